@@ -1,15 +1,33 @@
 # main.py
+import asyncio
+import hashlib
+import os
+from collections import OrderedDict
+from functools import partial
+
+import orjson
 from datetime import date, time
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Any, Optional, Literal
 
-from app.models.models import Machine, Mold, ProductComponent
-from app.services.ga_scheduler import ga_optimize_v2
+from app.models.models import (
+    COMPONENT_FIELDS,
+    MACHINE_FIELDS,
+    MOLD_FIELDS,
+    Machine,
+    Mold,
+    ProductComponent,
+)
+from app.services.ga_scheduler import ga_optimize_islands, ga_optimize_v2
+from app.services import cpsat_scheduler
 from app.api_v1 import router as api_router
 
-app = FastAPI(title="TaskAlign API")
+# orjson serializes the large schedule payloads several times faster than
+# the default json encoder and emits bytes directly.
+app = FastAPI(title="TaskAlign API", default_response_class=ORJSONResponse)
 
 # CORS for frontend
 app.add_middleware(
@@ -24,9 +42,18 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
+def _pool_workers() -> int:
+    # Divide cores by the uvicorn worker count (WEB_CONCURRENCY) so running
+    # with --workers > 1 doesn't oversubscribe the machine.
+    web_workers = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    return max(1, (os.cpu_count() or 1) // web_workers)
+
+
 # ── Pydantic input models ──────────────────────────────────────────
 
 class MachineIn(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     group: str = Field(..., description="small | medium | large")
@@ -37,6 +64,8 @@ class MachineIn(BaseModel):
 
 
 class MoldIn(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     group: str = Field(..., description="small | medium | large")
@@ -45,6 +74,8 @@ class MoldIn(BaseModel):
 
 
 class ComponentIn(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     id: str
     name: str
     quantity: int
@@ -55,7 +86,7 @@ class ComponentIn(BaseModel):
     start_date: Optional[date] = None
     due_date: date
     lead_time_days: int = 2
-    prerequisites: List[str] = []
+    prerequisites: List[str] = Field(default_factory=list)
     dependency_mode: Literal["wait_all", "parallel"] = "wait_all"
     dependency_transfer_time_minutes: int = 0
     order_code: Optional[str] = None
@@ -63,6 +94,8 @@ class ComponentIn(BaseModel):
 
 
 class ScheduleV2Request(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     month_days: int = 30
     mold_change_time_minutes: int = 0
     color_change_time_minutes: int = 0
@@ -74,6 +107,28 @@ class ScheduleV2Request(BaseModel):
     pop_size: int = 30
     n_generations: int = 80
     mutation_rate: float = 0.25
+    n_islands: int = Field(1, ge=1, le=64)
+    migration_interval: int = Field(10, ge=1)
+    seed: Optional[int] = None
+
+
+def _to_dc(cls, src, field_names):
+    return cls(*(getattr(src, f) for f in field_names))
+
+
+# Planners re-submit near-identical requests (same data, re-run to compare);
+# a seeded single-population run is deterministic, so its result can be
+# replayed from a small LRU keyed by a stable hash of the whole payload.
+# Unseeded runs are stochastic, and island runs are not reproducible even
+# when seeded (migration arrival depends on cross-process timing), so
+# neither is ever cached.
+RESULT_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_RESULT_CACHE_MAX = 32
+
+
+def _request_cache_key(request: "ScheduleV2Request") -> str:
+    canonical = orjson.dumps(request.model_dump(mode="json"), option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical).hexdigest()
 
 
 # ── Algorithm endpoints ───────────────────────────────────────────────────────
@@ -84,13 +139,84 @@ def read_root():
 
 
 @app.post("/schedule_v2")
-def schedule_v2(request: ScheduleV2Request) -> Dict[str, Any]:
+async def schedule_v2(request: ScheduleV2Request) -> Dict[str, Any]:
     try:
-        machines = [Machine(**m.model_dump()) for m in request.machines]
-        molds = [Mold(**m.model_dump()) for m in request.molds]
-        components = [ProductComponent(**c.model_dump()) for c in request.components]
-
-        result = ga_optimize_v2(
+        cache_key = None
+        if request.seed is not None and request.n_islands <= 1:
+            cache_key = _request_cache_key(request)
+            cached = RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                RESULT_CACHE.move_to_end(cache_key)
+                return cached
+
+        machines = [_to_dc(Machine, m, MACHINE_FIELDS) for m in request.machines]
+        molds = [_to_dc(Mold, m, MOLD_FIELDS) for m in request.molds]
+        components = [_to_dc(ProductComponent, c, COMPONENT_FIELDS) for c in request.components]
+
+        result: Optional[Dict[str, Any]] = None
+
+        # Small instances get the exact CP-SAT solver (milliseconds, proven
+        # order) instead of stochastic GA search; it falls back to the GA
+        # when no feasible order is found within the solver's time budget.
+        if cpsat_scheduler.is_tractable(components, machines):
+            run_cpsat = partial(
+                cpsat_scheduler.cpsat_optimize,
+                components=components,
+                machines=machines,
+                molds=molds,
+                month_days=request.month_days,
+                mold_change_time_minutes=request.mold_change_time_minutes,
+                color_change_time_minutes=request.color_change_time_minutes,
+                current_date=request.current_date,
+                start_time=request.start_time,
+            )
+            try:
+                result = await asyncio.get_running_loop().run_in_executor(None, run_cpsat)
+            except RuntimeError:
+                pass  # no feasible order in budget: use the GA below
+
+        if result is None:
+            result = await _run_ga_paths(request, components, machines, molds)
+
+        if cache_key is not None:
+            RESULT_CACHE[cache_key] = result
+            while len(RESULT_CACHE) > _RESULT_CACHE_MAX:
+                RESULT_CACHE.popitem(last=False)
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _run_ga_paths(
+    request: ScheduleV2Request,
+    components: List[ProductComponent],
+    machines: List[Machine],
+    molds: List[Mold],
+) -> Dict[str, Any]:
+    run_ga = partial(
+        ga_optimize_v2,
+        components=components,
+        machines=machines,
+        molds=molds,
+        month_days=request.month_days,
+        mold_change_time_minutes=request.mold_change_time_minutes,
+        color_change_time_minutes=request.color_change_time_minutes,
+        current_date=request.current_date,
+        start_time=request.start_time,
+        n_generations=request.n_generations,
+        mutation_rate=request.mutation_rate,
+    )
+
+    if request.n_islands > 1:
+        # Island model: parallel sub-populations on independent RNG
+        # streams, with ring migration of elites every
+        # migration_interval generations to spread good orderings
+        # without converging in lockstep. The orchestrator owns its
+        # worker processes for the duration of the run.
+        run_islands = partial(
+            ga_optimize_islands,
             components=components,
             machines=machines,
             molds=molds,
@@ -102,7 +228,19 @@ def schedule_v2(request: ScheduleV2Request) -> Dict[str, Any]:
             pop_size=request.pop_size,
             n_generations=request.n_generations,
             mutation_rate=request.mutation_rate,
+            n_islands=request.n_islands,
+            migration_interval=request.migration_interval,
+            seed=request.seed,
         )
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        return await asyncio.get_running_loop().run_in_executor(None, run_islands)
+
+    # Run the GA master loop off the event loop. The GA owns its evaluation
+    # pool (n_workers): the decode context is broadcast once per worker via
+    # the pool initializer instead of being pickled with every genome batch.
+    run_ga = partial(
+        run_ga,
+        pop_size=request.pop_size,
+        seed=request.seed,
+        n_workers=_pool_workers(),
+    )
+    return await asyncio.get_running_loop().run_in_executor(None, run_ga)
\ No newline at end of file
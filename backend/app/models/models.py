@@ -1,10 +1,10 @@
 # app/models/models.py
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import date
 from typing import List, Optional, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class Machine:
     id: str
     name: str
@@ -19,7 +19,7 @@ class Machine:
     status: Literal["available", "unavailable"] = "available"
 
 
-@dataclass
+@dataclass(slots=True)
 class Mold:
     id: str
     name: str
@@ -30,7 +30,7 @@ class Mold:
     component_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductComponent:
     id: str
     name: str
@@ -57,4 +57,11 @@ class ProductComponent:
     # Optional order-line grouping
     order_code: Optional[str] = None
 
-    status: str = "pending"
\ No newline at end of file
+    status: str = "pending"
+
+
+# Field-name tuples cached at import so conversion code iterates interned
+# strings instead of calling dataclasses.fields() reflection per use.
+MACHINE_FIELDS = tuple(f.name for f in fields(Machine))
+MOLD_FIELDS = tuple(f.name for f in fields(Mold))
+COMPONENT_FIELDS = tuple(f.name for f in fields(ProductComponent))
\ No newline at end of file
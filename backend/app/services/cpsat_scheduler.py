@@ -0,0 +1,160 @@
+# app/services/cpsat_scheduler.py
+"""Exact CP-SAT ordering solver for small scheduling instances.
+
+For small problems an exact solver finds a proven-good production order in
+milliseconds where the GA needs seconds of stochastic search. The CP-SAT
+model sequences components on machines and molds on a minute-resolution
+timeline; the resulting order is then materialized through the same
+decoder as the GA, so the response schema and every scheduling rule
+(changeovers, transfers, mold exclusivity, dependency modes) stay
+identical to the GA path.
+"""
+import math
+from datetime import date, time
+from typing import Any, Dict, List
+
+import numpy as np
+from ortools.sat.python import cp_model
+
+from app.models.models import Machine, Mold, ProductComponent
+from app.services.ga_scheduler import (
+    _build_machine_mold_compat,
+    _date_to_day_index,
+    _decode_v2,
+    _fitness_v2,
+    _piece_hours,
+)
+
+# Above this components x machines product the model leaves "milliseconds"
+# territory and the GA takes over.
+CPSAT_MAX_PROBLEM_SIZE = 160
+
+_SOLVER_TIME_LIMIT_S = 2.0
+_MINUTES_PER_DAY = 24 * 60
+
+
+def is_tractable(components: List[ProductComponent], machines: List[Machine]) -> bool:
+    return len(components) * len(machines) <= CPSAT_MAX_PROBLEM_SIZE
+
+
+def cpsat_optimize(
+    components: List[ProductComponent],
+    machines: List[Machine],
+    molds: List[Mold],
+    month_days: int,
+    mold_change_time_minutes: int,
+    color_change_time_minutes: int,
+    current_date: date,
+    start_time: time,
+) -> Dict[str, Any]:
+    """Solve the sequencing exactly and decode the order into a schedule.
+
+    Raises RuntimeError when the solver cannot produce a feasible order in
+    its time budget; callers fall back to the GA in that case.
+    """
+    compat, mold_index = _build_machine_mold_compat(machines, molds)
+
+    model = cp_model.CpModel()
+    horizon = month_days * _MINUTES_PER_DAY
+
+    modeled: List[int] = []
+    start_vars: Dict[int, Any] = {}
+    end_vars: Dict[int, Any] = {}
+    intervals_by_machine: Dict[int, list] = {m_i: [] for m_i in range(len(machines))}
+    intervals_by_mold: Dict[int, list] = {}
+    lateness_terms = []
+
+    for i, c in enumerate(components):
+        remaining = max(int(c.quantity) - int(c.finished or 0), 0)
+        mj = mold_index.get(c.mold_id, -1)
+        feasible_machines = [
+            m_i for m_i in range(len(machines))
+            if mj >= 0 and (int(compat[m_i, mj >> 6]) >> (mj & 63)) & 1
+        ]
+        if remaining <= 0 or c.cycle_time_sec <= 0 or not feasible_machines:
+            continue  # nothing to sequence / left to the decoder's unmet path
+
+        proc_min = max(1, math.ceil(remaining * _piece_hours(c.cycle_time_sec) * 60.0))
+        proc_min += int(mold_change_time_minutes) + int(color_change_time_minutes)
+        proc_min = min(proc_min, horizon)
+
+        sd = c.start_date or current_date
+        earliest = max(0, (_date_to_day_index(current_date, sd) - 1)) * _MINUTES_PER_DAY
+        earliest = min(earliest, horizon - proc_min)
+
+        start = model.NewIntVar(earliest, horizon - proc_min, f"start_{i}")
+        end = model.NewIntVar(0, horizon, f"end_{i}")
+        interval = model.NewIntervalVar(start, proc_min, end, f"iv_{i}")
+
+        modeled.append(i)
+        start_vars[i] = start
+        end_vars[i] = end
+        intervals_by_mold.setdefault(mj, []).append(interval)
+
+        assigned = []
+        for m_i in feasible_machines:
+            lit = model.NewBoolVar(f"on_{i}_{m_i}")
+            intervals_by_machine[m_i].append(
+                model.NewOptionalIntervalVar(start, proc_min, end, lit, f"iv_{i}_{m_i}")
+            )
+            assigned.append(lit)
+        model.AddExactlyOne(assigned)
+
+        if c.due_date is not None:
+            due_day = max(1, min(month_days, _date_to_day_index(current_date, c.due_date)))
+            lateness = model.NewIntVar(0, horizon, f"late_{i}")
+            model.AddMaxEquality(lateness, [end - due_day * _MINUTES_PER_DAY, 0])
+            lateness_terms.append(lateness)
+
+    by_id = {c.id: i for i, c in enumerate(components)}
+    for i in modeled:
+        for pr in components[i].prerequisites:
+            j = by_id.get(pr)
+            if j is not None and j in end_vars:
+                model.Add(start_vars[i] >= end_vars[j])
+
+    for ivs in intervals_by_machine.values():
+        if len(ivs) > 1:
+            model.AddNoOverlap(ivs)
+    for ivs in intervals_by_mold.values():
+        if len(ivs) > 1:
+            model.AddNoOverlap(ivs)
+
+    makespan = model.NewIntVar(0, horizon, "makespan")
+    if modeled:
+        model.AddMaxEquality(makespan, [end_vars[i] for i in modeled])
+    model.Minimize(sum(lateness_terms) * 10 + makespan)
+
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = _SOLVER_TIME_LIMIT_S
+    solver.parameters.num_search_workers = 1
+    status = solver.Solve(model)
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        raise RuntimeError("CP-SAT found no feasible order; fall back to GA")
+
+    # Solution start times give the production order; unmodeled components
+    # go last and the decoder handles them (already finished / infeasible).
+    order = sorted(modeled, key=lambda i: solver.Value(start_vars[i]))
+    order += [i for i in range(len(components)) if i not in start_vars]
+    genome = np.array(order, dtype=np.int32)
+
+    tasks, unmet, due_day_by_id, lead_time_days_by_id, _cols = _decode_v2(
+        genome=genome,
+        components=components,
+        machines=machines,
+        molds=molds,
+        month_days=month_days,
+        mold_change_time_minutes=mold_change_time_minutes,
+        color_change_time_minutes=color_change_time_minutes,
+        current_date=current_date,
+        shift_start_time=start_time,
+        machine_mold_compat=compat,
+        mold_index=mold_index,
+    )
+    score = _fitness_v2(tasks, unmet, components, due_day_by_id, lead_time_days_by_id)
+
+    return {
+        "assignments": tasks,
+        "unmet": unmet,
+        "score": score,
+    }
@@ -1,26 +1,104 @@
 # app/services/ga_scheduler.py
-import random
+import heapq
+import math
+import multiprocessing
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, time, timedelta
-from typing import Dict, List, Tuple, Any, Optional
+from functools import partial
+from queue import Empty, Full
+from typing import Callable, Dict, List, Tuple, Any, Optional
+
+import numpy as np
 
 from app.models.models import Machine, Mold, ProductComponent
+from app.services.ga_scheduler_kernels import (
+    TASK_CHANGE_COLOR,
+    TASK_CHANGE_MOLD,
+    TASK_PRODUCE,
+    TASK_TRANSFER,
+    TASK_WAIT,
+    fitness_from_columns,
+    fitness_from_tasks,
+)
 
 EPS = 1e-9
 
 
-def _overlaps(a_start: float, a_end: float, b_start: float, b_end: float) -> bool:
-    return not (a_end <= b_start or b_end <= a_start)
+class _IntervalSet:
+    """Busy windows for one (day, mold), kept sorted by start hour.
+
+    Parallel starts/ends columns let queries bisect to the candidate window
+    instead of scanning every reserved interval. They are array.array('d')
+    rather than lists of boxed floats: a month grid holds thousands of these
+    tiny sets, and packed doubles keep them at 8 bytes per entry and
+    cache-friendly for the bisect scans. max_len (the longest interval seen
+    so far) bounds how far left of a query an overlapping interval can
+    begin, so the scan covers only starts in [query_start - max_len,
+    query_end).
+    """
+
+    __slots__ = ("starts", "ends", "max_len")
+
+    def __init__(self) -> None:
+        self.starts = array("d")
+        self.ends = array("d")
+        self.max_len: float = 0.0
+
+    def add(self, start: float, end: float) -> None:
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        if end - start > self.max_len:
+            self.max_len = end - start
+
+    def is_free(self, start: float, end: float) -> bool:
+        starts = self.starts
+        ends = self.ends
+        hi = bisect_left(starts, end)
+        lo = bisect_left(starts, start - self.max_len)
+        for k in range(lo, hi):
+            if ends[k] > start:
+                return False
+        return True
+
+    def next_busy_start(self, after_hour: float) -> Optional[float]:
+        i = bisect_left(self.starts, after_hour + EPS)
+        return self.starts[i] if i < len(self.starts) else None
+
+
+class _TaskColumns:
+    """SoA mirror of the emitted task list, filled in decode order.
+
+    The fitness kernel consumes these columns directly, so scoring no longer
+    re-walks the task dicts to repack them into typed arrays.
+    """
+
+    __slots__ = ("task_type", "day", "qty", "used_hours", "comp_idx")
 
+    def __init__(self) -> None:
+        self.task_type: List[int] = []
+        self.day: List[int] = []
+        self.qty: List[int] = []
+        self.used_hours: List[float] = []
+        self.comp_idx: List[int] = []
 
-def _interval_is_free(intervals: List[Tuple[float, float]], start: float, end: float) -> bool:
-    for s, e in intervals:
-        if _overlaps(s, e, start, end):
-            return False
-    return True
+    def add(self, task_type: int, day: int, qty: int, used_hours: float, comp_idx: int) -> None:
+        self.task_type.append(task_type)
+        self.day.append(day)
+        self.qty.append(qty)
+        self.used_hours.append(used_hours)
+        self.comp_idx.append(comp_idx)
 
 
-def _reserve_interval(intervals: List[Tuple[float, float]], start: float, end: float) -> None:
-    intervals.append((start, end))
+def _interval_is_free(intervals: _IntervalSet, start: float, end: float) -> bool:
+    return intervals.is_free(start, end)
+
+
+def _reserve_interval(intervals: _IntervalSet, start: float, end: float) -> None:
+    intervals.add(start, end)
 
 
 def _build_dependency_graph(
@@ -41,43 +119,105 @@ def _build_dependency_graph(
     return indeg, graph, prereqs_of
 
 
+def _dependency_context(
+    components: List[ProductComponent],
+) -> Tuple[Dict[str, int], Dict[str, List[str]], Dict[str, int]]:
+    """In-degrees, successor graph and unlock scores for one request.
+
+    Genome-independent, so ga_optimize_v2 builds this once and every decode
+    reuses it (prerequisite validation then also happens once, up front).
+    """
+    indeg, graph, _ = _build_dependency_graph(components)
+    unlock_score = {c.id: len(graph.get(c.id, [])) for c in components}
+    return indeg, graph, unlock_score
+
+
 def _topological_order_priority(
     components: List[ProductComponent],
-    rank: Dict[str, int],
+    rank: np.ndarray,
+    comp_index: Dict[str, int],
     unlock_score: Dict[str, int],
+    indeg: Optional[Dict[str, int]] = None,
+    graph: Optional[Dict[str, List[str]]] = None,
 ) -> List[ProductComponent]:
     by_id = {c.id: c for c in components}
-    indeg, graph, _ = _build_dependency_graph(components)
-
-    ready = [cid for cid, d in indeg.items() if d == 0]
+    if indeg is None or graph is None:
+        indeg, graph, _ = _build_dependency_graph(components)
+    degrees = dict(indeg)  # consumed below; callers share the original
+
+    # A heap replaces the former sort-whole-list-then-pop(0) per iteration:
+    # O(log N) per ready component instead of O(N log N).
+    ready = [
+        (-int(unlock_score.get(cid, 0)), int(rank[comp_index[cid]]), cid)
+        for cid, d in degrees.items()
+        if d == 0
+    ]
+    heapq.heapify(ready)
     out: List[ProductComponent] = []
 
     while ready:
-        ready.sort(key=lambda cid: (-int(unlock_score.get(cid, 0)), int(rank.get(cid, 10**9))))
-        cid = ready.pop(0)
+        _neg_unlock, _rk, cid = heapq.heappop(ready)
 
         out.append(by_id[cid])
         for nxt in graph[cid]:
-            indeg[nxt] -= 1
-            if indeg[nxt] == 0:
-                ready.append(nxt)
+            degrees[nxt] -= 1
+            if degrees[nxt] == 0:
+                heapq.heappush(
+                    ready,
+                    (-int(unlock_score.get(nxt, 0)), int(rank[comp_index[nxt]]), nxt),
+                )
 
     if len(out) != len(components):
         raise ValueError("Circular dependency detected in prerequisites.")
     return out
 
 
-def _feasible_on_machine(comp: ProductComponent, machine: Machine, molds_by_id: Dict[str, Mold]) -> bool:
-    mold = molds_by_id.get(comp.mold_id)
-    if mold is None:
-        return False
-    if mold.group != machine.group:
-        return False
-    if mold.tonnage > machine.tonnage:
-        return False
-    if comp.cycle_time_sec <= 0:
-        return False
-    return True
+def _build_machine_mold_compat(
+    machines: List[Machine], molds: List[Mold]
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """Bitmask of which machines can host which molds (group + tonnage).
+
+    Row i covers machines[i]; bit j (word j >> 6, bit j & 63) is set iff
+    molds[j] fits. A shift+AND then replaces the per-candidate group string
+    compare, tonnage compare and mold dict lookup.
+    """
+    mold_index = {m.id: j for j, m in enumerate(molds)}
+    n_words = max(1, (len(molds) + 63) // 64)
+    compat = np.zeros((len(machines), n_words), dtype=np.uint64)
+    for i, mach in enumerate(machines):
+        for j, mold in enumerate(molds):
+            if mold.group == mach.group and mold.tonnage <= mach.tonnage:
+                compat[i, j >> 6] |= np.uint64(1) << np.uint64(j & 63)
+    return compat, mold_index
+
+
+def _build_feasibility_matrix(
+    components: List[ProductComponent],
+    machines: List[Machine],
+    molds: List[Mold],
+    machine_mold_compat: Optional[np.ndarray] = None,
+    mold_index: Optional[Dict[str, int]] = None,
+) -> np.ndarray:
+    """(machine, component) boolean matrix of who can ever run what.
+
+    Collapses the per-candidate checks that never change during the search
+    (mold exists, mold fits the machine per the compat bitmask, component
+    has a positive cycle time) into a single precomputed boolean load.
+    """
+    if machine_mold_compat is None or mold_index is None:
+        machine_mold_compat, mold_index = _build_machine_mold_compat(machines, molds)
+
+    feasible = np.zeros((len(machines), len(components)), dtype=bool)
+    for ci, c in enumerate(components):
+        if c.cycle_time_sec <= 0:
+            continue
+        mj = mold_index.get(c.mold_id, -1)
+        if mj < 0:
+            continue
+        for m_pos in range(len(machines)):
+            if (int(machine_mold_compat[m_pos, mj >> 6]) >> (mj & 63)) & 1:
+                feasible[m_pos, ci] = True
+    return feasible
 
 
 def _piece_hours(cycle_time_sec: float) -> float:
@@ -111,26 +251,51 @@ def _fmt_time(dt: datetime) -> str:
     return dt.strftime("%H:%M:%S")
 
 
+def _prereq_csr(
+    components: List[ProductComponent],
+    comp_index: Dict[str, int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Prerequisite adjacency in CSR form (indptr/indices over comp indices).
+
+    Component i's prerequisites are pre_indices[pre_indptr[i]:pre_indptr[i+1]];
+    the readiness check then walks a bounded integer slice instead of a
+    Python list of id strings.
+    """
+    indptr = np.zeros(len(components) + 1, dtype=np.int32)
+    flat: List[int] = []
+    for i, c in enumerate(components):
+        for pr in c.prerequisites:
+            flat.append(comp_index[pr])
+        indptr[i + 1] = len(flat)
+    return indptr, np.array(flat, dtype=np.int32)
+
+
 def _next_ready_time_due_to_prereqs_wait_all(
-    comp: ProductComponent,
-    completion_time: Dict[str, Tuple[int, float]],
+    ci: int,
+    pre_indptr: np.ndarray,
+    pre_indices: np.ndarray,
+    completion_day: np.ndarray,
+    completion_hour: np.ndarray,
     day: int,
     after_hour: float,
 ) -> Optional[float]:
-    needed: List[float] = []
-    for pr in comp.prerequisites:
-        if pr not in completion_time:
+    lo = int(pre_indptr[ci])
+    hi = int(pre_indptr[ci + 1])
+    ready = after_hour
+    for k in range(lo, hi):
+        pi = pre_indices[k]
+        pr_day = completion_day[pi]
+        if pr_day < 0 or pr_day > day:
             return None
-        pr_day, pr_hour = completion_time[pr]
-        if pr_day > day:
-            return None
-        if pr_day == day and pr_hour > after_hour + EPS:
-            needed.append(pr_hour)
-    return max(needed) if needed else after_hour
+        if pr_day == day:
+            pr_hour = completion_hour[pi]
+            if pr_hour > after_hour + EPS and pr_hour > ready:
+                ready = pr_hour
+    return ready
 
 
 def _next_mold_free_time_for_window(
-    mold_intervals: List[Tuple[float, float]],
+    mold_intervals: _IntervalSet,
     after_hour: float,
     window_hours: float,
     cap: float,
@@ -139,27 +304,27 @@ def _next_mold_free_time_for_window(
     if window_hours <= 0:
         return after_hour if after_hour <= cap + EPS else None
 
-    if after_hour + window_hours <= cap + EPS and _interval_is_free(mold_intervals, after_hour, after_hour + window_hours):
-        return after_hour
+    # Reservations are disjoint and sorted by start, so one forward sweep
+    # finds the earliest gap: jump past the interval covering after_hour,
+    # then keep absorbing any interval that starts before the window fits.
+    starts = mold_intervals.starts
+    ends = mold_intervals.ends
+    n = len(starts)
 
     t = after_hour
-    safety = 0
-    while t + window_hours <= cap + EPS:
-        safety += 1
-        if safety > 10_000:
-            return None
+    i = bisect_right(starts, t) - 1
+    if i >= 0 and ends[i] > t:
+        t = ends[i]
+    while i + 1 < n and starts[i + 1] < t + window_hours:
+        i += 1
+        if ends[i] > t:
+            t = ends[i]
 
-        overlaps = [(s, e) for (s, e) in mold_intervals if _overlaps(s, e, t, t + window_hours)]
-        if not overlaps:
-            return t
-        t = max(e for (_s, e) in overlaps)
+    return t if t + window_hours <= cap + EPS else None
 
-    return None
 
-
-def _next_busy_start(intervals: List[Tuple[float, float]], after_hour: float) -> Optional[float]:
-    starts = [s for (s, _e) in intervals if s >= after_hour + EPS]
-    return min(starts) if starts else None
+def _next_busy_start(intervals: _IntervalSet, after_hour: float) -> Optional[float]:
+    return intervals.next_busy_start(after_hour)
 
 
 def _fitness_v2(
@@ -169,110 +334,53 @@ def _fitness_v2(
     due_day_by_id: Dict[str, int],
     lead_time_days_by_id: Dict[str, int],
 ) -> float:
-    unmet_pen = sum(unmet.values()) * 1_000_000.0
-
-    produced_total = 0
-    on_time_qty = 0
-    late_qty = 0
-    weighted_late_qty = 0
-
-    changeover_hours = 0.0
-    wait_hours = 0.0
-    transfer_hours = 0.0
-
-    first_prod_day: Dict[str, int] = {}
-
-    for t in tasks:
-        tt = t["task_type"]
-        if tt == "PRODUCE":
-            qty = int(t.get("produced_qty", 0))
-            produced_total += qty
-            cid = t["component_id"]
-            first_prod_day[cid] = min(first_prod_day.get(cid, 10**9), int(t["day"]))
-
-            due_day = int(due_day_by_id.get(cid, 10**9))
-            if int(t["day"]) <= due_day:
-                on_time_qty += qty
-            else:
-                days_late = int(t["day"]) - due_day
-                late_qty += qty
-                weighted_late_qty += qty * max(days_late, 1)
-
-        elif tt in ("CHANGE_MOLD", "CHANGE_COLOR"):
-            changeover_hours += float(t.get("used_hours", 0.0))
-        elif tt == "WAIT":
-            wait_hours += float(t.get("used_hours", 0.0))
-        elif tt == "TRANSFER":
-            transfer_hours += float(t.get("used_hours", 0.0))
-
-    late_start_pen = 0.0
-    for cid, d in first_prod_day.items():
-        due_day = int(due_day_by_id.get(cid, 10**9))
-        ltd = int(lead_time_days_by_id.get(cid, 0))
-        latest_start = due_day - ltd
-        if latest_start < 1:
-            latest_start = 1
-        if d > latest_start:
-            late_start_pen += (d - latest_start) * 2_000.0
-
-    late_prod_pen = (late_qty * 2_000.0) + (weighted_late_qty * 500.0)
-
-    return (
-        on_time_qty * 5.0
-        + produced_total * 1.0
-        - unmet_pen
-        - late_prod_pen
-        - late_start_pen
-        - (changeover_hours * 50.0)
-        - (transfer_hours * 20.0)
-        - (wait_hours * 5.0)
+    """Score a decoded schedule via the JIT'd kernel in ga_scheduler_kernels."""
+    comp_index = {c.id: i for i, c in enumerate(components)}
+    due_day = np.array([due_day_by_id[c.id] for c in components], dtype=np.int16)
+    latest_start = np.maximum(
+        np.int16(1),
+        due_day
+        - np.array([lead_time_days_by_id[c.id] for c in components], dtype=np.int16),
     )
+    return fitness_from_tasks(tasks, unmet, comp_index, due_day, latest_start)
 
 
-def _random_genome(components: List[ProductComponent]) -> List[str]:
-    ids = [c.id for c in components]
-    random.shuffle(ids)
-    return ids
-
-
-def _mutate_swap(genome: List[str]) -> List[str]:
-    if len(genome) < 2:
-        return genome
-    i, j = random.sample(range(len(genome)), 2)
-    genome[i], genome[j] = genome[j], genome[i]
-    return genome
-
-
-def _crossover_ox(p1: List[str], p2: List[str]) -> List[str]:
-    n = len(p1)
-    if n < 2:
-        return p1[:]
-    a, b = sorted(random.sample(range(n), 2))
-    mid = p1[a:b]
-    rest = [x for x in p2 if x not in mid]
-    return rest[:a] + mid + rest[a:]
-
-
-def _decode_v2(
-    genome: List[str],
+def _due_latest_arrays(
     components: List[ProductComponent],
-    machines: List[Machine],
-    molds: List[Mold],
-    month_days: int,
-    mold_change_time_minutes: int,
-    color_change_time_minutes: int,
     current_date: date,
-    shift_start_time: time,
-) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[str, int], Dict[str, int]]:
-    molds_by_id = {m.id: m for m in molds}
-
-    rank = {cid: i for i, cid in enumerate(genome)}
-
-    _indeg, dep_graph, _pr = _build_dependency_graph(components)
-    unlock_score: Dict[str, int] = {c.id: len(dep_graph.get(c.id, [])) for c in components}
+    month_days: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Clamped due-day and latest-start columns, matching _decode_v2's rules.
+
+    Both are fixed for a given request, so the GA computes them once and
+    binds them into the evaluation closure; the latest-start clamp
+    (due - lead, floored at day 1) then never has to be redone inside the
+    fitness kernel.
+    """
+    due = np.empty(len(components), dtype=np.int16)
+    latest = np.empty(len(components), dtype=np.int16)
+    for i, c in enumerate(components):
+        dd = getattr(c, "due_date", None)
+        if dd is None:
+            raise ValueError(f"Component '{c.id}' is missing due_date (required).")
+        due[i] = max(1, min(month_days, _date_to_day_index(current_date, dd)))
+        latest[i] = max(1, due[i] - int(getattr(c, "lead_time_days", 0) or 0))
+    return due, latest
 
-    comp_order = _topological_order_priority(components, rank=rank, unlock_score=unlock_score)
 
+def _day_window_maps(
+    components: List[ProductComponent],
+    current_date: date,
+    month_days: int,
+) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+    """Per-component start/due/lead maps, clamped to the planning month.
+
+    Genome-invariant: ga_optimize_v2 builds these once per request and binds
+    them into the evaluation closure, so repeated decodes skip the per-call
+    date arithmetic. (The decoder itself stays in Python: it emits dict tasks
+    keyed by id strings, so only its numeric scoring half is JIT-compiled,
+    in ga_scheduler_kernels.)
+    """
     start_day_by_id: Dict[str, int] = {}
     due_day_by_id: Dict[str, int] = {}
     lead_time_days_by_id: Dict[str, int] = {}
@@ -286,103 +394,247 @@ def _decode_v2(
         sdi = _date_to_day_index(current_date, sd)
         ddi = _date_to_day_index(current_date, dd)
 
-        sdi = max(1, min(month_days, sdi))
-        ddi = max(1, min(month_days, ddi))
-
-        start_day_by_id[c.id] = sdi
-        due_day_by_id[c.id] = ddi
+        start_day_by_id[c.id] = max(1, min(month_days, sdi))
+        due_day_by_id[c.id] = max(1, min(month_days, ddi))
         lead_time_days_by_id[c.id] = int(getattr(c, "lead_time_days", 0) or 0)
 
-    remaining: Dict[str, int] = {}
-    for c in components:
+    return start_day_by_id, due_day_by_id, lead_time_days_by_id
+
+
+def _base_remaining(components: List[ProductComponent]) -> np.ndarray:
+    """Open quantity per component before any scheduling (also invariant)."""
+    remaining = np.empty(len(components), dtype=np.int64)
+    for i, c in enumerate(components):
         finished = int(getattr(c, "finished", 0) or 0)
-        remaining[c.id] = max(int(c.quantity) - finished, 0)
+        remaining[i] = max(int(c.quantity) - finished, 0)
+    return remaining
 
-    completion_time: Dict[str, Tuple[int, float]] = {}
 
-    mold_busy: Dict[int, Dict[str, List[Tuple[float, float]]]] = {
-        d: {m.id: [] for m in molds} for d in range(1, month_days + 1)
-    }
+def _mutate_swap(genome: np.ndarray, i: int, j: int) -> np.ndarray:
+    """Swap genes i and j in place; the genome is an int32 index permutation.
 
-    machine_state: Dict[str, Dict[str, Optional[str]]] = {
-        m.id: {"mold_id": None, "color": None, "last_component_id": None} for m in machines
-    }
+    The positions are drawn by the caller (batched per generation) rather
+    than per call.
+    """
+    if len(genome) < 2 or i == j:
+        return genome
+    genome[i], genome[j] = genome[j], genome[i]
+    return genome
+
+
+def _crossover_ox(
+    p1: np.ndarray, p2: np.ndarray, out: np.ndarray, mask: np.ndarray, a: int, b: int
+) -> None:
+    """Order crossover written into a preallocated child row.
+
+    The cut points a <= b are drawn by the caller (batched per generation).
+    mask is a caller-owned bool scratch array of genome length, assumed all
+    False on entry; membership of the copied slice is marked and then
+    cleared on the same b-a slots, so the scratch is reused across every
+    crossover in a run without zeroing the whole array.
+    """
+    n = len(p1)
+    if n < 2:
+        out[:] = p1
+        return
+    mid = p1[a:b]
+    # Membership as a boolean mask over gene values: rest is one vectorized
+    # gather instead of a per-element set lookup.
+    mask[mid] = True
+    rest = p2[~mask[p2]]
+    out[:a] = rest[:a]
+    out[a:b] = mid
+    out[b:] = rest[a:]
+    mask[mid] = False
+
+
+def _decode_v2(
+    genome: np.ndarray,
+    components: List[ProductComponent],
+    machines: List[Machine],
+    molds: List[Mold],
+    month_days: int,
+    mold_change_time_minutes: int,
+    color_change_time_minutes: int,
+    current_date: date,
+    shift_start_time: time,
+    machine_mold_compat: Optional[np.ndarray] = None,
+    mold_index: Optional[Dict[str, int]] = None,
+    piece_hours: Optional[np.ndarray] = None,
+    day_windows: Optional[Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]] = None,
+    open_quantity: Optional[np.ndarray] = None,
+    dep_ctx: Optional[Tuple[Dict[str, int], Dict[str, List[str]], Dict[str, int]]] = None,
+    feasible: Optional[np.ndarray] = None,
+    prereq_csr: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    emit_tasks: bool = True,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int], Dict[str, int], Dict[str, int], "_TaskColumns"]:
+    if machine_mold_compat is None or mold_index is None:
+        machine_mold_compat, mold_index = _build_machine_mold_compat(machines, molds)
+    if piece_hours is None:
+        piece_hours = np.array([_piece_hours(c.cycle_time_sec) for c in components])
+    if day_windows is None:
+        day_windows = _day_window_maps(components, current_date, month_days)
+    if open_quantity is None:
+        open_quantity = _base_remaining(components)
+    if dep_ctx is None:
+        dep_ctx = _dependency_context(components)
+    if feasible is None:
+        feasible = _build_feasibility_matrix(
+            components, machines, molds, machine_mold_compat, mold_index
+        )
+    comp_index = {c.id: i for i, c in enumerate(components)}
+    if prereq_csr is None:
+        prereq_csr = _prereq_csr(components, comp_index)
+    pre_indptr, pre_indices = prereq_csr
+    n_comp = len(components)
+    n_molds = len(molds)
+
+    # The genome is a permutation of component indices (int32); component
+    # bookkeeping below is dense arrays indexed by that same component index,
+    # so the hot loops do integer loads instead of hashing id strings.
+    rank = np.empty(n_comp, dtype=np.int32)
+    rank[genome] = np.arange(n_comp, dtype=np.int32)
+    comp_mold_idx = np.array(
+        [mold_index.get(c.mold_id, -1) for c in components], dtype=np.int32
+    )
+
+    indeg, dep_graph, unlock_score = dep_ctx
+
+    comp_order = _topological_order_priority(
+        components,
+        rank=rank,
+        comp_index=comp_index,
+        unlock_score=unlock_score,
+        indeg=indeg,
+        graph=dep_graph,
+    )
 
-    component_owner: Dict[str, str] = {}
+    start_day_by_id, due_day_by_id, lead_time_days_by_id = day_windows
+    remaining = open_quantity.copy()
+
+    completion_day = np.full(n_comp, -1, dtype=np.int32)
+    completion_hour = np.zeros(n_comp, dtype=np.float64)
+
+    # Busy windows as a flat (day, mold) grid of interval sets.
+    mold_busy: List[_IntervalSet] = [
+        _IntervalSet() for _ in range(month_days * n_molds)
+    ]
+
+    # Machine state as position-indexed columns instead of six id-keyed dicts
+    # rebuilt every day: the capacity/clock/seq/done columns are reset in
+    # place, and the mold/color/last-component columns persist across days
+    # (so no separate carry-over dict is needed either).
+    n_machines = len(machines)
+    usable = np.array(
+        [
+            float(m.hours_per_day) * float(m.efficiency)
+            if getattr(m, "status", "available") == "available"
+            else 0.0
+            for m in machines
+        ],
+        dtype=np.float64,
+    )
+    t = np.zeros(n_machines, dtype=np.float64)
+    seq = np.ones(n_machines, dtype=np.int32)
+    done = np.zeros(n_machines, dtype=bool)
+    current_mold: List[Optional[str]] = [None] * n_machines
+    current_color: List[Optional[str]] = [None] * n_machines
+    last_component: List[Optional[str]] = [None] * n_machines
+
+    component_owner = np.full(n_comp, -1, dtype=np.int32)  # machine position
+    # Timeline dicts (with formatted datetimes) are only built when
+    # emit_tasks is set; GA search scores genomes from the SoA columns
+    # alone, so the hundreds of dicts per decode exist only for the one
+    # genome that is actually returned.
     tasks: List[Dict[str, Any]] = []
+    cols = _TaskColumns()
 
     # track if a component has already had its one-time transfer (for wait_all)
-    transfer_done_once: set[str] = set()
+    transfer_done_once = np.zeros(n_comp, dtype=bool)
 
-    mold_change_h = _minutes_to_hours(mold_change_time_minutes)
-    color_change_h = _minutes_to_hours(color_change_time_minutes)
+    mold_change_h = max(0.0, _minutes_to_hours(mold_change_time_minutes))
+    color_change_h = max(0.0, _minutes_to_hours(color_change_time_minutes))
 
     shift_start_hour = _time_to_float_hour(shift_start_time)
 
     for day in range(1, month_days + 1):
-        usable: Dict[str, float] = {}
-        for m in machines:
-            if getattr(m, "status", "available") != "available":
-                usable[m.id] = 0.0
-            else:
-                usable[m.id] = float(m.hours_per_day) * float(m.efficiency)
-
-        t: Dict[str, float] = {m.id: 0.0 for m in machines}
-        seq: Dict[str, int] = {m.id: 1 for m in machines}
-        done: Dict[str, bool] = {m.id: (usable[m.id] <= EPS) for m in machines}
-
-        current_mold: Dict[str, Optional[str]] = {m.id: machine_state[m.id]["mold_id"] for m in machines}
-        current_color: Dict[str, Optional[str]] = {m.id: machine_state[m.id]["color"] for m in machines}
-        last_component: Dict[str, Optional[str]] = {m.id: machine_state[m.id]["last_component_id"] for m in machines}
+        day_base = (day - 1) * n_molds
+        t[:] = 0.0
+        seq[:] = 1
+        done[:] = usable <= EPS
+
+        # Earliest-machine selection via a min-heap keyed on (t, position)
+        # instead of rebuilding and sorting the active list per event. Each
+        # event only moves the processed machine's clock, so its entry is
+        # re-pushed at the top of the next iteration; the staleness check on
+        # pop is a lazy-deletion guard.
+        machine_heap = [
+            (0.0, m_pos) for m_pos in range(n_machines) if not done[m_pos]
+        ]
+        heapq.heapify(machine_heap)
+        prev_pos = -1
 
         while True:
-            active = [m for m in machines if (not done[m.id]) and (t[m.id] < usable[m.id] - EPS)]
-            if not active:
+            if prev_pos >= 0:
+                if not done[prev_pos] and t[prev_pos] < usable[prev_pos] - EPS:
+                    heapq.heappush(machine_heap, (t[prev_pos], prev_pos))
+                prev_pos = -1
+
+            machine = None
+            while machine_heap:
+                now_t, m_pos = heapq.heappop(machine_heap)
+                if done[m_pos] or now_t != t[m_pos] or now_t >= usable[m_pos] - EPS:
+                    continue
+                machine = machines[m_pos]
+                break
+            if machine is None:
                 break
 
-            active.sort(key=lambda m: t[m.id])
-            machine = active[0]
+            prev_pos = m_pos
             mid = machine.id
 
-            now = t[mid]
-            cap = usable[mid]
+            now = t[m_pos]
+            cap = usable[m_pos]
 
             candidates = []
-            wait_candidates_next_times: List[float] = []
+            # Running minimum of the next mold-free times seen while scanning
+            # candidates; avoids growing a list just to take min() later.
+            best_wait = math.inf
 
             for comp in comp_order:
-                if remaining[comp.id] <= 0:
+                ci = comp_index[comp.id]
+                if remaining[ci] <= 0:
                     continue
 
                 if day < start_day_by_id[comp.id]:
                     continue
 
-                owner = component_owner.get(comp.id)
-                if owner is not None and owner != mid:
+                owner = component_owner[ci]
+                if owner >= 0 and owner != m_pos:
                     continue
 
-                if not _feasible_on_machine(comp, machine, molds_by_id):
+                if not feasible[m_pos, ci]:
                     continue
 
-                need_mold_change = (current_mold[mid] != comp.mold_id)
-                need_color_change = (current_color[mid] != comp.color)
+                need_mold_change = (current_mold[m_pos] != comp.mold_id)
+                need_color_change = (current_color[m_pos] != comp.color)
 
                 setup = 0.0
                 if need_color_change:
-                    setup += max(0.0, color_change_h)
+                    setup += color_change_h
                 if need_mold_change:
-                    setup += max(0.0, mold_change_h)
+                    setup += mold_change_h
 
                 start_after_setup = now + setup
-                per_piece_h = _piece_hours(comp.cycle_time_sec)
-                if per_piece_h <= 0:
-                    continue
+                per_piece_h = piece_hours[ci]
 
                 mode = getattr(comp, "dependency_mode", "wait_all") or "wait_all"
                 transfer_h = _minutes_to_hours(int(getattr(comp, "dependency_transfer_time_minutes", 0) or 0))
 
                 if mode == "wait_all":
-                    prereq_ready = _next_ready_time_due_to_prereqs_wait_all(comp, completion_time, day, start_after_setup)
+                    prereq_ready = _next_ready_time_due_to_prereqs_wait_all(
+                        ci, pre_indptr, pre_indices, completion_day, completion_hour, day, start_after_setup
+                    )
                     if prereq_ready is None:
                         continue
                     transfer_start = max(start_after_setup, prereq_ready)
@@ -395,9 +647,7 @@ def _decode_v2(
                 if produce_start + per_piece_h > cap + EPS:
                     continue
 
-                intervals = mold_busy[day].get(comp.mold_id)
-                if intervals is None:
-                    continue
+                intervals = mold_busy[day_base + comp_mold_idx[ci]]
 
                 if need_mold_change and mold_change_h > 0.0:
                     mold_hold_start = now + (color_change_h if need_color_change else 0.0)
@@ -409,14 +659,14 @@ def _decode_v2(
                 if not _interval_is_free(intervals, mold_hold_start, mold_hold_end_min):
                     required_window = mold_hold_end_min - mold_hold_start
                     nxt = _next_mold_free_time_for_window(intervals, mold_hold_start, required_window, cap)
-                    if nxt is not None and nxt > now + EPS and nxt < cap - EPS:
-                        wait_candidates_next_times.append(nxt)
+                    if nxt is not None and now + EPS < nxt < cap - EPS and nxt < best_wait:
+                        best_wait = nxt
                     continue
 
-                sticky = 1 if (last_component[mid] is not None and comp.id == last_component[mid]) else 0
+                sticky = 1 if (last_component[m_pos] is not None and comp.id == last_component[m_pos]) else 0
                 unlock = int(unlock_score.get(comp.id, 0))
-                color_match = 1 if (current_color[mid] is not None and comp.color == current_color[mid]) else 0
-                mold_match = 1 if (current_mold[mid] is not None and comp.mold_id == current_mold[mid]) else 0
+                color_match = 1 if (current_color[m_pos] is not None and comp.color == current_color[m_pos]) else 0
+                mold_match = 1 if (current_mold[m_pos] is not None and comp.mold_id == current_mold[m_pos]) else 0
                 due_day = due_day_by_id[comp.id]
 
                 candidates.append(
@@ -426,239 +676,263 @@ def _decode_v2(
                         -due_day,
                         color_match,
                         mold_match,
-                        rank.get(comp.id, 10**9),
+                        int(rank[ci]),
                         comp,
                         need_color_change,
                         need_mold_change,
+                        per_piece_h,
+                        mode,
+                        transfer_h,
                     )
                 )
 
             if not candidates:
-                if wait_candidates_next_times:
-                    t_next = min(wait_candidates_next_times)
+                if best_wait < math.inf:
+                    t_next = best_wait
                     if t_next > now + EPS:
                         wait_h = t_next - now
-                        start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                        end_dt = _hour_to_datetime(current_date, shift_start_time, day, t_next)
-                        tasks.append({
-                            "day": day,
-                            "date": str(_day_index_to_date(current_date, day)),
-                            "machine_id": mid,
-                            "machine_name": machine.name,
-                            "machine_group": machine.group,
-                            "sequence_in_day": seq[mid],
-                            "task_type": "WAIT",
-                            "used_hours": wait_h,
-                            "start_hour": now,
-                            "end_hour": t_next,
-                            "start_hour_clock": shift_start_hour + float(now),
-                            "end_hour_clock": shift_start_hour + float(t_next),
-                            "start_time": _fmt_time(start_dt),
-                            "end_time": _fmt_time(end_dt),
-                            "start_datetime": start_dt.isoformat(),
-                            "end_datetime": end_dt.isoformat(),
-                            "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
-                        })
-                        t[mid] = t_next
-                        seq[mid] += 1
+                        if emit_tasks:
+                            start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                            end_dt = _hour_to_datetime(current_date, shift_start_time, day, t_next)
+                            tasks.append({
+                                "day": day,
+                                "date": str(_day_index_to_date(current_date, day)),
+                                "machine_id": mid,
+                                "machine_name": machine.name,
+                                "machine_group": machine.group,
+                                "sequence_in_day": int(seq[m_pos]),
+                                "task_type": "WAIT",
+                                "used_hours": wait_h,
+                                "start_hour": now,
+                                "end_hour": t_next,
+                                "start_hour_clock": shift_start_hour + float(now),
+                                "end_hour_clock": shift_start_hour + float(t_next),
+                                "start_time": _fmt_time(start_dt),
+                                "end_time": _fmt_time(end_dt),
+                                "start_datetime": start_dt.isoformat(),
+                                "end_datetime": end_dt.isoformat(),
+                                "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
+                            })
+                        cols.add(TASK_WAIT, day, 0, wait_h, -1)
+                        t[m_pos] = t_next
+                        seq[m_pos] += 1
                         continue
 
-                done[mid] = True
-                t[mid] = cap
+                done[m_pos] = True
+                t[m_pos] = cap
                 continue
 
-            if last_component[mid] is not None and any(c[0] == 1 for c in candidates):
+            if last_component[m_pos] is not None and any(c[0] == 1 for c in candidates):
                 candidates = [c for c in candidates if c[0] == 1]
 
             candidates.sort(key=lambda x: (-x[0], -x[1], x[2], -x[3], -x[4], x[5]))
+            # The candidate scan already derived these; carry them in the
+            # tuple rather than re-deriving for the chosen component.
             chosen: ProductComponent = candidates[0][6]
             need_color_change = candidates[0][7]
             need_mold_change = candidates[0][8]
+            per_piece_h = candidates[0][9]
+            mode = candidates[0][10]
+            transfer_h = candidates[0][11]
+            chosen_ci = comp_index[chosen.id]
 
             # CHANGE_COLOR
             if need_color_change and color_change_h > 0.0:
                 if now + color_change_h > cap + EPS:
-                    done[mid] = True
-                    t[mid] = cap
+                    done[m_pos] = True
+                    t[m_pos] = cap
                     continue
-                start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                end_dt = _hour_to_datetime(current_date, shift_start_time, day, now + color_change_h)
-                tasks.append({
-                    "day": day,
-                    "date": str(_day_index_to_date(current_date, day)),
-                    "machine_id": mid,
-                    "machine_name": machine.name,
-                    "machine_group": machine.group,
-                    "sequence_in_day": seq[mid],
-                    "task_type": "CHANGE_COLOR",
-                    "from_color": current_color[mid],
-                    "to_color": chosen.color,
-                    "used_hours": color_change_h,
-                    "start_hour": now,
-                    "end_hour": now + color_change_h,
-                    "start_hour_clock": shift_start_hour + float(now),
-                    "end_hour_clock": shift_start_hour + float(now + color_change_h),
-                    "start_time": _fmt_time(start_dt),
-                    "end_time": _fmt_time(end_dt),
-                    "start_datetime": start_dt.isoformat(),
-                    "end_datetime": end_dt.isoformat(),
-                    "utilization": min(1.0, color_change_h / cap) if cap > EPS else 0.0,
-                })
+                if emit_tasks:
+                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, now + color_change_h)
+                    tasks.append({
+                        "day": day,
+                        "date": str(_day_index_to_date(current_date, day)),
+                        "machine_id": mid,
+                        "machine_name": machine.name,
+                        "machine_group": machine.group,
+                        "sequence_in_day": int(seq[m_pos]),
+                        "task_type": "CHANGE_COLOR",
+                        "from_color": current_color[m_pos],
+                        "to_color": chosen.color,
+                        "used_hours": color_change_h,
+                        "start_hour": now,
+                        "end_hour": now + color_change_h,
+                        "start_hour_clock": shift_start_hour + float(now),
+                        "end_hour_clock": shift_start_hour + float(now + color_change_h),
+                        "start_time": _fmt_time(start_dt),
+                        "end_time": _fmt_time(end_dt),
+                        "start_datetime": start_dt.isoformat(),
+                        "end_datetime": end_dt.isoformat(),
+                        "utilization": min(1.0, color_change_h / cap) if cap > EPS else 0.0,
+                    })
+                cols.add(TASK_CHANGE_COLOR, day, 0, color_change_h, -1)
                 now += color_change_h
-                t[mid] = now
-                seq[mid] += 1
-            current_color[mid] = chosen.color
+                t[m_pos] = now
+                seq[m_pos] += 1
+            current_color[m_pos] = chosen.color
 
             # CHANGE_MOLD
             if need_mold_change and mold_change_h > 0.0:
                 if now + mold_change_h > cap + EPS:
-                    done[mid] = True
-                    t[mid] = cap
+                    done[m_pos] = True
+                    t[m_pos] = cap
                     continue
 
-                intervals = mold_busy[day][chosen.mold_id]
+                intervals = mold_busy[day_base + comp_mold_idx[chosen_ci]]
                 if not _interval_is_free(intervals, now, now + mold_change_h):
                     nxt = _next_mold_free_time_for_window(intervals, now, mold_change_h, cap)
                     if nxt is not None and nxt > now + EPS and nxt < cap - EPS:
                         wait_h = nxt - now
-                        start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                        end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
-                        tasks.append({
-                            "day": day,
-                            "date": str(_day_index_to_date(current_date, day)),
-                            "machine_id": mid,
-                            "machine_name": machine.name,
-                            "machine_group": machine.group,
-                            "sequence_in_day": seq[mid],
-                            "task_type": "WAIT",
-                            "used_hours": wait_h,
-                            "start_hour": now,
-                            "end_hour": nxt,
-                            "start_hour_clock": shift_start_hour + float(now),
-                            "end_hour_clock": shift_start_hour + float(nxt),
-                            "start_time": _fmt_time(start_dt),
-                            "end_time": _fmt_time(end_dt),
-                            "start_datetime": start_dt.isoformat(),
-                            "end_datetime": end_dt.isoformat(),
-                            "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
-                        })
-                        t[mid] = nxt
-                        seq[mid] += 1
+                        if emit_tasks:
+                            start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                            end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
+                            tasks.append({
+                                "day": day,
+                                "date": str(_day_index_to_date(current_date, day)),
+                                "machine_id": mid,
+                                "machine_name": machine.name,
+                                "machine_group": machine.group,
+                                "sequence_in_day": int(seq[m_pos]),
+                                "task_type": "WAIT",
+                                "used_hours": wait_h,
+                                "start_hour": now,
+                                "end_hour": nxt,
+                                "start_hour_clock": shift_start_hour + float(now),
+                                "end_hour_clock": shift_start_hour + float(nxt),
+                                "start_time": _fmt_time(start_dt),
+                                "end_time": _fmt_time(end_dt),
+                                "start_datetime": start_dt.isoformat(),
+                                "end_datetime": end_dt.isoformat(),
+                                "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
+                            })
+                        cols.add(TASK_WAIT, day, 0, wait_h, -1)
+                        t[m_pos] = nxt
+                        seq[m_pos] += 1
                         continue
 
-                    done[mid] = True
-                    t[mid] = cap
+                    done[m_pos] = True
+                    t[m_pos] = cap
                     continue
 
                 _reserve_interval(intervals, now, now + mold_change_h)
-                start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                end_dt = _hour_to_datetime(current_date, shift_start_time, day, now + mold_change_h)
-                tasks.append({
-                    "day": day,
-                    "date": str(_day_index_to_date(current_date, day)),
-                    "machine_id": mid,
-                    "machine_name": machine.name,
-                    "machine_group": machine.group,
-                    "sequence_in_day": seq[mid],
-                    "task_type": "CHANGE_MOLD",
-                    "from_mold_id": current_mold[mid],
-                    "to_mold_id": chosen.mold_id,
-                    "used_hours": mold_change_h,
-                    "start_hour": now,
-                    "end_hour": now + mold_change_h,
-                    "start_hour_clock": shift_start_hour + float(now),
-                    "end_hour_clock": shift_start_hour + float(now + mold_change_h),
-                    "start_time": _fmt_time(start_dt),
-                    "end_time": _fmt_time(end_dt),
-                    "start_datetime": start_dt.isoformat(),
-                    "end_datetime": end_dt.isoformat(),
-                    "utilization": min(1.0, mold_change_h / cap) if cap > EPS else 0.0,
-                })
+                if emit_tasks:
+                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, now + mold_change_h)
+                    tasks.append({
+                        "day": day,
+                        "date": str(_day_index_to_date(current_date, day)),
+                        "machine_id": mid,
+                        "machine_name": machine.name,
+                        "machine_group": machine.group,
+                        "sequence_in_day": int(seq[m_pos]),
+                        "task_type": "CHANGE_MOLD",
+                        "from_mold_id": current_mold[m_pos],
+                        "to_mold_id": chosen.mold_id,
+                        "used_hours": mold_change_h,
+                        "start_hour": now,
+                        "end_hour": now + mold_change_h,
+                        "start_hour_clock": shift_start_hour + float(now),
+                        "end_hour_clock": shift_start_hour + float(now + mold_change_h),
+                        "start_time": _fmt_time(start_dt),
+                        "end_time": _fmt_time(end_dt),
+                        "start_datetime": start_dt.isoformat(),
+                        "end_datetime": end_dt.isoformat(),
+                        "utilization": min(1.0, mold_change_h / cap) if cap > EPS else 0.0,
+                    })
+                cols.add(TASK_CHANGE_MOLD, day, 0, mold_change_h, -1)
                 now += mold_change_h
-                t[mid] = now
-                seq[mid] += 1
-            current_mold[mid] = chosen.mold_id
+                t[m_pos] = now
+                seq[m_pos] += 1
+            current_mold[m_pos] = chosen.mold_id
 
             # WAIT for prereqs (wait_all only)
-            mode = getattr(chosen, "dependency_mode", "wait_all") or "wait_all"
-            transfer_h = _minutes_to_hours(int(getattr(chosen, "dependency_transfer_time_minutes", 0) or 0))
-
             if mode == "wait_all":
-                prereq_ready_now = _next_ready_time_due_to_prereqs_wait_all(chosen, completion_time, day, now)
+                prereq_ready_now = _next_ready_time_due_to_prereqs_wait_all(
+                    chosen_ci, pre_indptr, pre_indices, completion_day, completion_hour, day, now
+                )
                 if prereq_ready_now is None:
-                    done[mid] = True
-                    t[mid] = cap
+                    done[m_pos] = True
+                    t[m_pos] = cap
                     continue
 
                 if prereq_ready_now > now + EPS:
                     if prereq_ready_now >= cap - EPS:
-                        done[mid] = True
-                        t[mid] = cap
+                        done[m_pos] = True
+                        t[m_pos] = cap
                         continue
 
-                    intervals = mold_busy[day].get(current_mold[mid]) if current_mold[mid] else None
+                    intervals = (
+                        mold_busy[day_base + mold_index[current_mold[m_pos]]]
+                        if current_mold[m_pos]
+                        else None
+                    )
                     if intervals is not None:
                         if not _interval_is_free(intervals, now, prereq_ready_now):
                             nxt = _next_mold_free_time_for_window(intervals, now, prereq_ready_now - now, cap)
                             if nxt is not None and nxt > now + EPS and nxt < cap - EPS:
                                 wait_h = nxt - now
-                                start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                                end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
-                                tasks.append({
-                                    "day": day,
-                                    "date": str(_day_index_to_date(current_date, day)),
-                                    "machine_id": mid,
-                                    "machine_name": machine.name,
-                                    "machine_group": machine.group,
-                                    "sequence_in_day": seq[mid],
-                                    "task_type": "WAIT",
-                                    "used_hours": wait_h,
-                                    "start_hour": now,
-                                    "end_hour": nxt,
-                                    "start_hour_clock": shift_start_hour + float(now),
-                                    "end_hour_clock": shift_start_hour + float(nxt),
-                                    "start_time": _fmt_time(start_dt),
-                                    "end_time": _fmt_time(end_dt),
-                                    "start_datetime": start_dt.isoformat(),
-                                    "end_datetime": end_dt.isoformat(),
-                                    "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
-                                })
+                                if emit_tasks:
+                                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
+                                    tasks.append({
+                                        "day": day,
+                                        "date": str(_day_index_to_date(current_date, day)),
+                                        "machine_id": mid,
+                                        "machine_name": machine.name,
+                                        "machine_group": machine.group,
+                                        "sequence_in_day": int(seq[m_pos]),
+                                        "task_type": "WAIT",
+                                        "used_hours": wait_h,
+                                        "start_hour": now,
+                                        "end_hour": nxt,
+                                        "start_hour_clock": shift_start_hour + float(now),
+                                        "end_hour_clock": shift_start_hour + float(nxt),
+                                        "start_time": _fmt_time(start_dt),
+                                        "end_time": _fmt_time(end_dt),
+                                        "start_datetime": start_dt.isoformat(),
+                                        "end_datetime": end_dt.isoformat(),
+                                        "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
+                                    })
+                                cols.add(TASK_WAIT, day, 0, wait_h, -1)
                                 now = nxt
-                                t[mid] = now
-                                seq[mid] += 1
+                                t[m_pos] = now
+                                seq[m_pos] += 1
                                 continue
 
-                            done[mid] = True
-                            t[mid] = cap
+                            done[m_pos] = True
+                            t[m_pos] = cap
                             continue
 
                         _reserve_interval(intervals, now, prereq_ready_now)
 
                     wait_h = prereq_ready_now - now
-                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, prereq_ready_now)
-                    tasks.append({
-                        "day": day,
-                        "date": str(_day_index_to_date(current_date, day)),
-                        "machine_id": mid,
-                        "machine_name": machine.name,
-                        "machine_group": machine.group,
-                        "sequence_in_day": seq[mid],
-                        "task_type": "WAIT",
-                        "used_hours": wait_h,
-                        "start_hour": now,
-                        "end_hour": prereq_ready_now,
-                        "start_hour_clock": shift_start_hour + float(now),
-                        "end_hour_clock": shift_start_hour + float(prereq_ready_now),
-                        "start_time": _fmt_time(start_dt),
-                        "end_time": _fmt_time(end_dt),
-                        "start_datetime": start_dt.isoformat(),
-                        "end_datetime": end_dt.isoformat(),
-                        "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
-                    })
+                    if emit_tasks:
+                        start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                        end_dt = _hour_to_datetime(current_date, shift_start_time, day, prereq_ready_now)
+                        tasks.append({
+                            "day": day,
+                            "date": str(_day_index_to_date(current_date, day)),
+                            "machine_id": mid,
+                            "machine_name": machine.name,
+                            "machine_group": machine.group,
+                            "sequence_in_day": int(seq[m_pos]),
+                            "task_type": "WAIT",
+                            "used_hours": wait_h,
+                            "start_hour": now,
+                            "end_hour": prereq_ready_now,
+                            "start_hour_clock": shift_start_hour + float(now),
+                            "end_hour_clock": shift_start_hour + float(prereq_ready_now),
+                            "start_time": _fmt_time(start_dt),
+                            "end_time": _fmt_time(end_dt),
+                            "start_datetime": start_dt.isoformat(),
+                            "end_datetime": end_dt.isoformat(),
+                            "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
+                        })
+                    cols.add(TASK_WAIT, day, 0, wait_h, -1)
                     now = prereq_ready_now
-                    t[mid] = now
-                    seq[mid] += 1
+                    t[m_pos] = now
+                    seq[m_pos] += 1
 
             # TRANSFER
             do_transfer = False
@@ -668,105 +942,108 @@ def _decode_v2(
                     do_transfer = True
                 elif mode == "wait_all":
                     # wait_all: transfer only once, when the component first starts
-                    do_transfer = (chosen.id not in transfer_done_once)
+                    do_transfer = not transfer_done_once[chosen_ci]
 
             if do_transfer:
                 if now + transfer_h > cap + EPS:
-                    done[mid] = True
-                    t[mid] = cap
+                    done[m_pos] = True
+                    t[m_pos] = cap
                     continue
 
-                if current_mold[mid] is not None:
-                    intervals = mold_busy[day].get(current_mold[mid])
+                if current_mold[m_pos] is not None:
+                    intervals = mold_busy[day_base + mold_index[current_mold[m_pos]]]
                     if intervals is not None:
                         if not _interval_is_free(intervals, now, now + transfer_h):
                             nxt = _next_mold_free_time_for_window(intervals, now, transfer_h, cap)
                             if nxt is not None and nxt > now + EPS and nxt < cap - EPS:
                                 wait_h = nxt - now
-                                start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                                end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
-                                tasks.append({
-                                    "day": day,
-                                    "date": str(_day_index_to_date(current_date, day)),
-                                    "machine_id": mid,
-                                    "machine_name": machine.name,
-                                    "machine_group": machine.group,
-                                    "sequence_in_day": seq[mid],
-                                    "task_type": "WAIT",
-                                    "used_hours": wait_h,
-                                    "start_hour": now,
-                                    "end_hour": nxt,
-                                    "start_hour_clock": shift_start_hour + float(now),
-                                    "end_hour_clock": shift_start_hour + float(nxt),
-                                    "start_time": _fmt_time(start_dt),
-                                    "end_time": _fmt_time(end_dt),
-                                    "start_datetime": start_dt.isoformat(),
-                                    "end_datetime": end_dt.isoformat(),
-                                    "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
-                                })
+                                if emit_tasks:
+                                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
+                                    tasks.append({
+                                        "day": day,
+                                        "date": str(_day_index_to_date(current_date, day)),
+                                        "machine_id": mid,
+                                        "machine_name": machine.name,
+                                        "machine_group": machine.group,
+                                        "sequence_in_day": int(seq[m_pos]),
+                                        "task_type": "WAIT",
+                                        "used_hours": wait_h,
+                                        "start_hour": now,
+                                        "end_hour": nxt,
+                                        "start_hour_clock": shift_start_hour + float(now),
+                                        "end_hour_clock": shift_start_hour + float(nxt),
+                                        "start_time": _fmt_time(start_dt),
+                                        "end_time": _fmt_time(end_dt),
+                                        "start_datetime": start_dt.isoformat(),
+                                        "end_datetime": end_dt.isoformat(),
+                                        "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
+                                    })
+                                cols.add(TASK_WAIT, day, 0, wait_h, -1)
                                 now = nxt
-                                t[mid] = now
-                                seq[mid] += 1
+                                t[m_pos] = now
+                                seq[m_pos] += 1
                                 continue
 
-                            done[mid] = True
-                            t[mid] = cap
+                            done[m_pos] = True
+                            t[m_pos] = cap
                             continue
 
                         _reserve_interval(intervals, now, now + transfer_h)
 
-                start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
-                end_dt = _hour_to_datetime(current_date, shift_start_time, day, now + transfer_h)
-                tasks.append({
-                    "day": day,
-                    "date": str(_day_index_to_date(current_date, day)),
-                    "machine_id": mid,
-                    "machine_name": machine.name,
-                    "machine_group": machine.group,
-                    "sequence_in_day": seq[mid],
-                    "task_type": "TRANSFER",
-                    "component_id": chosen.id,
-                    "component_name": chosen.name,
-                    "used_hours": transfer_h,
-                    "start_hour": now,
-                    "end_hour": now + transfer_h,
-                    "start_hour_clock": shift_start_hour + float(now),
-                    "end_hour_clock": shift_start_hour + float(now + transfer_h),
-                    "start_time": _fmt_time(start_dt),
-                    "end_time": _fmt_time(end_dt),
-                    "start_datetime": start_dt.isoformat(),
-                    "end_datetime": end_dt.isoformat(),
-                    "utilization": min(1.0, transfer_h / cap) if cap > EPS else 0.0,
-                })
-                transfer_done_once.add(chosen.id)
+                if emit_tasks:
+                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, now)
+                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, now + transfer_h)
+                    tasks.append({
+                        "day": day,
+                        "date": str(_day_index_to_date(current_date, day)),
+                        "machine_id": mid,
+                        "machine_name": machine.name,
+                        "machine_group": machine.group,
+                        "sequence_in_day": int(seq[m_pos]),
+                        "task_type": "TRANSFER",
+                        "component_id": chosen.id,
+                        "component_name": chosen.name,
+                        "used_hours": transfer_h,
+                        "start_hour": now,
+                        "end_hour": now + transfer_h,
+                        "start_hour_clock": shift_start_hour + float(now),
+                        "end_hour_clock": shift_start_hour + float(now + transfer_h),
+                        "start_time": _fmt_time(start_dt),
+                        "end_time": _fmt_time(end_dt),
+                        "start_datetime": start_dt.isoformat(),
+                        "end_datetime": end_dt.isoformat(),
+                        "utilization": min(1.0, transfer_h / cap) if cap > EPS else 0.0,
+                    })
+                cols.add(TASK_TRANSFER, day, 0, transfer_h, -1)
+                transfer_done_once[chosen_ci] = True
                 now += transfer_h
-                t[mid] = now
-                seq[mid] += 1
+                t[m_pos] = now
+                seq[m_pos] += 1
 
             # PRODUCE
-            per_piece_h = _piece_hours(chosen.cycle_time_sec)
             if per_piece_h <= 0:
-                done[mid] = True
-                t[mid] = cap
+                done[m_pos] = True
+                t[m_pos] = cap
                 continue
 
             start_prod = now
-            intervals = mold_busy[day][chosen.mold_id]
+            intervals = mold_busy[day_base + comp_mold_idx[chosen_ci]]
 
             nxt_busy = _next_busy_start(intervals, start_prod)
             hard_end = cap if nxt_busy is None else min(cap, nxt_busy)
             available_run_h = hard_end - start_prod
 
             if available_run_h < per_piece_h - EPS:
-                done[mid] = True
-                t[mid] = cap
+                done[m_pos] = True
+                t[m_pos] = cap
                 continue
 
             max_qty_fit = int(available_run_h // per_piece_h)
-            qty = min(remaining[chosen.id], max_qty_fit)
+            qty = int(min(remaining[chosen_ci], max_qty_fit))
             if qty <= 0:
-                done[mid] = True
-                t[mid] = cap
+                done[m_pos] = True
+                t[m_pos] = cap
                 continue
 
             used_h = qty * per_piece_h
@@ -776,84 +1053,164 @@ def _decode_v2(
                 nxt = _next_mold_free_time_for_window(intervals, start_prod, per_piece_h, cap)
                 if nxt is not None and nxt > start_prod + EPS and nxt < cap - EPS:
                     wait_h = nxt - start_prod
-                    start_dt = _hour_to_datetime(current_date, shift_start_time, day, start_prod)
-                    end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
-                    tasks.append({
-                        "day": day,
-                        "date": str(_day_index_to_date(current_date, day)),
-                        "machine_id": mid,
-                        "machine_name": machine.name,
-                        "machine_group": machine.group,
-                        "sequence_in_day": seq[mid],
-                        "task_type": "WAIT",
-                        "used_hours": wait_h,
-                        "start_hour": start_prod,
-                        "end_hour": nxt,
-                        "start_hour_clock": shift_start_hour + float(start_prod),
-                        "end_hour_clock": shift_start_hour + float(nxt),
-                        "start_time": _fmt_time(start_dt),
-                        "end_time": _fmt_time(end_dt),
-                        "start_datetime": start_dt.isoformat(),
-                        "end_datetime": end_dt.isoformat(),
-                        "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
-                    })
-                    t[mid] = nxt
-                    seq[mid] += 1
+                    if emit_tasks:
+                        start_dt = _hour_to_datetime(current_date, shift_start_time, day, start_prod)
+                        end_dt = _hour_to_datetime(current_date, shift_start_time, day, nxt)
+                        tasks.append({
+                            "day": day,
+                            "date": str(_day_index_to_date(current_date, day)),
+                            "machine_id": mid,
+                            "machine_name": machine.name,
+                            "machine_group": machine.group,
+                            "sequence_in_day": int(seq[m_pos]),
+                            "task_type": "WAIT",
+                            "used_hours": wait_h,
+                            "start_hour": start_prod,
+                            "end_hour": nxt,
+                            "start_hour_clock": shift_start_hour + float(start_prod),
+                            "end_hour_clock": shift_start_hour + float(nxt),
+                            "start_time": _fmt_time(start_dt),
+                            "end_time": _fmt_time(end_dt),
+                            "start_datetime": start_dt.isoformat(),
+                            "end_datetime": end_dt.isoformat(),
+                            "utilization": min(1.0, wait_h / cap) if cap > EPS else 0.0,
+                        })
+                    cols.add(TASK_WAIT, day, 0, wait_h, -1)
+                    t[m_pos] = nxt
+                    seq[m_pos] += 1
                     continue
-                done[mid] = True
-                t[mid] = cap
+                done[m_pos] = True
+                t[m_pos] = cap
                 continue
 
             _reserve_interval(intervals, start_prod, end_prod)
 
-            if chosen.id not in component_owner:
-                component_owner[chosen.id] = mid
-
-            start_dt = _hour_to_datetime(current_date, shift_start_time, day, start_prod)
-            end_dt = _hour_to_datetime(current_date, shift_start_time, day, end_prod)
-            tasks.append({
-                "day": day,
-                "date": str(_day_index_to_date(current_date, day)),
-                "machine_id": mid,
-                "machine_name": machine.name,
-                "machine_group": machine.group,
-                "sequence_in_day": seq[mid],
-                "task_type": "PRODUCE",
-                "mold_id": chosen.mold_id,
-                "component_id": chosen.id,
-                "component_name": chosen.name,
-                "color": chosen.color,
-                "produced_qty": qty,
-                "used_hours": used_h,
-                "start_hour": start_prod,
-                "end_hour": end_prod,
-                "start_hour_clock": shift_start_hour + float(start_prod),
-                "end_hour_clock": shift_start_hour + float(end_prod),
-                "start_time": _fmt_time(start_dt),
-                "end_time": _fmt_time(end_dt),
-                "start_datetime": start_dt.isoformat(),
-                "end_datetime": end_dt.isoformat(),
-                "utilization": min(1.0, used_h / cap) if cap > EPS else 0.0,
-            })
-
-            remaining[chosen.id] -= qty
-            last_component[mid] = chosen.id
-            current_mold[mid] = chosen.mold_id
-            current_color[mid] = chosen.color
-
-            t[mid] = end_prod
-            seq[mid] += 1
-
-            if remaining[chosen.id] <= 0:
-                completion_time[chosen.id] = (day, end_prod)
-
-        for m in machines:
-            machine_state[m.id]["mold_id"] = current_mold[m.id]
-            machine_state[m.id]["color"] = current_color[m.id]
-            machine_state[m.id]["last_component_id"] = last_component[m.id]
-
-    unmet = {cid: qty for cid, qty in remaining.items() if qty > 0}
-    return tasks, unmet, due_day_by_id, lead_time_days_by_id
+            if component_owner[chosen_ci] < 0:
+                component_owner[chosen_ci] = m_pos
+
+            if emit_tasks:
+                start_dt = _hour_to_datetime(current_date, shift_start_time, day, start_prod)
+                end_dt = _hour_to_datetime(current_date, shift_start_time, day, end_prod)
+                tasks.append({
+                    "day": day,
+                    "date": str(_day_index_to_date(current_date, day)),
+                    "machine_id": mid,
+                    "machine_name": machine.name,
+                    "machine_group": machine.group,
+                    "sequence_in_day": int(seq[m_pos]),
+                    "task_type": "PRODUCE",
+                    "mold_id": chosen.mold_id,
+                    "component_id": chosen.id,
+                    "component_name": chosen.name,
+                    "color": chosen.color,
+                    "produced_qty": qty,
+                    "used_hours": used_h,
+                    "start_hour": start_prod,
+                    "end_hour": end_prod,
+                    "start_hour_clock": shift_start_hour + float(start_prod),
+                    "end_hour_clock": shift_start_hour + float(end_prod),
+                    "start_time": _fmt_time(start_dt),
+                    "end_time": _fmt_time(end_dt),
+                    "start_datetime": start_dt.isoformat(),
+                    "end_datetime": end_dt.isoformat(),
+                    "utilization": min(1.0, used_h / cap) if cap > EPS else 0.0,
+                })
+            cols.add(TASK_PRODUCE, day, qty, used_h, chosen_ci)
+
+            remaining[chosen_ci] -= qty
+            last_component[m_pos] = chosen.id
+            current_mold[m_pos] = chosen.mold_id
+            current_color[m_pos] = chosen.color
+
+            t[m_pos] = end_prod
+            seq[m_pos] += 1
+
+            if remaining[chosen_ci] <= 0:
+                completion_day[chosen_ci] = day
+                completion_hour[chosen_ci] = end_prod
+
+    unmet = {
+        components[i].id: int(qty) for i, qty in enumerate(remaining) if qty > 0
+    }
+    return tasks, unmet, due_day_by_id, lead_time_days_by_id, cols
+
+
+def _evaluate_genome(
+    genome: np.ndarray,
+    components: List[ProductComponent],
+    machines: List[Machine],
+    molds: List[Mold],
+    month_days: int,
+    mold_change_time_minutes: int,
+    color_change_time_minutes: int,
+    current_date: date,
+    start_time: time,
+    machine_mold_compat: Optional[np.ndarray] = None,
+    mold_index: Optional[Dict[str, int]] = None,
+    piece_hours: Optional[np.ndarray] = None,
+    due_day_arr: Optional[np.ndarray] = None,
+    latest_arr: Optional[np.ndarray] = None,
+    day_windows: Optional[Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]] = None,
+    open_quantity: Optional[np.ndarray] = None,
+    dep_ctx: Optional[Tuple[Dict[str, int], Dict[str, List[str]], Dict[str, int]]] = None,
+    feasible: Optional[np.ndarray] = None,
+    prereq_csr: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> float:
+    """Decode one genome and return its fitness score.
+
+    Top-level (picklable) so it can be mapped over a process pool. When the
+    caller pre-binds due_day_arr/latest_arr, the decode runs in score-only
+    mode: the SoA task columns feed the fitness kernel directly and no
+    timeline dicts are built.
+    """
+    score_only = due_day_arr is not None and latest_arr is not None
+    tasks, unmet, due_day_by_id, lead_time_days_by_id, cols = _decode_v2(
+        genome=genome,
+        components=components,
+        machines=machines,
+        molds=molds,
+        month_days=month_days,
+        mold_change_time_minutes=mold_change_time_minutes,
+        color_change_time_minutes=color_change_time_minutes,
+        current_date=current_date,
+        shift_start_time=start_time,
+        machine_mold_compat=machine_mold_compat,
+        mold_index=mold_index,
+        piece_hours=piece_hours,
+        day_windows=day_windows,
+        open_quantity=open_quantity,
+        dep_ctx=dep_ctx,
+        feasible=feasible,
+        prereq_csr=prereq_csr,
+        emit_tasks=not score_only,
+    )
+    if score_only:
+        return fitness_from_columns(
+            cols.task_type,
+            cols.day,
+            cols.qty,
+            cols.used_hours,
+            cols.comp_idx,
+            sum(unmet.values()),
+            due_day_arr,
+            latest_arr,
+        )
+    return _fitness_v2(tasks, unmet, components, due_day_by_id, lead_time_days_by_id)
+
+
+# Per-worker evaluation context. The pool initializer broadcasts the fully
+# bound evaluate partial once per worker process; per-generation tasks then
+# pickle only the genome row instead of the whole decode context.
+_EVAL_CTX: Optional[Callable] = None
+
+
+def _init_eval_ctx(evaluate: Callable) -> None:
+    global _EVAL_CTX
+    _EVAL_CTX = evaluate
+
+
+def _evaluate_in_worker(genome: np.ndarray) -> float:
+    return _EVAL_CTX(genome)
 
 
 def ga_optimize_v2(
@@ -868,6 +1225,11 @@ def ga_optimize_v2(
     pop_size: int = 30,
     n_generations: int = 80,
     mutation_rate: float = 0.25,
+    map_fn: Callable = map,
+    n_workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    migration_queues: Optional[Tuple[Any, Any]] = None,
+    migration_interval: int = 10,
 ) -> Dict[str, Any]:
     if month_days < 1:
         raise ValueError("month_days must be >= 1")
@@ -879,58 +1241,213 @@ def ga_optimize_v2(
         raise ValueError("mutation_rate must be between 0 and 1")
     if mold_change_time_minutes < 0 or color_change_time_minutes < 0:
         raise ValueError("changeover minutes must be >= 0")
+    if migration_interval < 1:
+        raise ValueError("migration_interval must be >= 1")
+
+    # Nothing to schedule: return the empty result directly rather than
+    # running generations of zero-length genomes (the batched RNG draws
+    # below also need a non-empty index range).
+    if not components:
+        return {"assignments": [], "unmet": {}, "score": 0.0}
+
+    # One Generator per call: distinct seeds give island-model runs (one
+    # optimize call per worker process) independent RNG streams instead of a
+    # forked shared state, and batched draws below replace the many tiny
+    # module-level random.* calls in the mating loop.
+    rng = np.random.default_rng(seed)
+
+    # Machine/mold compatibility is search-invariant: build the bitmask once
+    # and reuse it for every decode.
+    machine_mold_compat, mold_index = _build_machine_mold_compat(machines, molds)
+
+    # Per-piece hours are invariant across the whole search; hoist the
+    # seconds-to-hours division out of the candidate loops.
+    piece_hours = np.array([_piece_hours(c.cycle_time_sec) for c in components])
+
+    # Stage the request-invariant fitness inputs once; the evaluate partial
+    # below is effectively a fitness function specialized to this request.
+    due_day_arr, latest_arr = _due_latest_arrays(components, current_date, month_days)
+    day_windows = _day_window_maps(components, current_date, month_days)
+    open_quantity = _base_remaining(components)
+    dep_ctx = _dependency_context(components)
+    feasible = _build_feasibility_matrix(
+        components, machines, molds, machine_mold_compat, mold_index
+    )
+    prereq_csr = _prereq_csr(components, {c.id: i for i, c in enumerate(components)})
+
+    # Genomes are int32 index permutations held in two preallocated
+    # (pop_size, n_comp) buffers; generations alternate between them instead
+    # of rebuilding lists of id strings every iteration.
+    n_comp = len(components)
+    population = np.empty((pop_size, n_comp), dtype=np.int32)
+    next_pop = np.empty_like(population)
+    ox_mask = np.zeros(n_comp, dtype=bool)  # crossover scratch, kept clear
+    for i in range(pop_size):
+        population[i] = rng.permutation(n_comp)
+
+    # Master-slave evaluation: selection/crossover/mutation stay here, but
+    # per-genome decode+fitness can be farmed out (e.g. ProcessPoolExecutor.map).
+    evaluate = partial(
+        _evaluate_genome,
+        components=components,
+        machines=machines,
+        molds=molds,
+        month_days=month_days,
+        mold_change_time_minutes=mold_change_time_minutes,
+        color_change_time_minutes=color_change_time_minutes,
+        current_date=current_date,
+        start_time=start_time,
+        machine_mold_compat=machine_mold_compat,
+        mold_index=mold_index,
+        piece_hours=piece_hours,
+        due_day_arr=due_day_arr,
+        latest_arr=latest_arr,
+        day_windows=day_windows,
+        open_quantity=open_quantity,
+        dep_ctx=dep_ctx,
+        feasible=feasible,
+        prereq_csr=prereq_csr,
+    )
 
-    population = [_random_genome(components) for _ in range(pop_size)]
+    # Master-slave pool owned by this call (when n_workers asks for one):
+    # decode context rides in via the initializer, so only genome rows cross
+    # the process boundary per generation.
+    pool: Optional[ProcessPoolExecutor] = None
+    if n_workers is not None and n_workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_eval_ctx,
+            initargs=(evaluate,),
+        )
+        map_fn = partial(pool.map, chunksize=max(1, pop_size // (4 * n_workers)))
+        evaluate = _evaluate_in_worker
 
     best_score = None
     best_genome = None
 
-    for _ in range(n_generations):
-        scored = []
-        for g in population:
-            tasks, unmet, due_day_by_id, lead_time_days_by_id = _decode_v2(
-                genome=g,
-                components=components,
-                machines=machines,
-                molds=molds,
-                month_days=month_days,
-                mold_change_time_minutes=mold_change_time_minutes,
-                color_change_time_minutes=color_change_time_minutes,
-                current_date=current_date,
-                shift_start_time=start_time,
-            )
-            score = _fitness_v2(tasks, unmet, components, due_day_by_id, lead_time_days_by_id)
-            scored.append((score, g))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        if best_score is None or scored[0][0] > best_score:
-            best_score = scored[0][0]
-            best_genome = scored[0][1][:]
-
-        elite_k = max(2, pop_size // 5)
-        new_pop = [g[:] for (_, g) in scored[:elite_k]]
-
-        while len(new_pop) < pop_size:
-            i, j = random.sample(range(pop_size), 2)
-            parent = scored[i][1] if scored[i][0] > scored[j][0] else scored[j][1]
-            new_pop.append(parent[:])
-
-        children = []
-        for i in range(0, pop_size, 2):
-            if i + 1 >= pop_size:
-                children.append(new_pop[i][:])
-                break
-            c1 = _crossover_ox(new_pop[i], new_pop[i + 1])
-            c2 = _crossover_ox(new_pop[i + 1], new_pop[i])
-            children.extend([c1, c2])
+    # Memoize fitness per call (inputs differ between requests, so no module
+    # global): elitism and late-generation convergence re-submit identical
+    # genomes, which then cost a dict lookup instead of a full decode.
+    fitness_cache: "OrderedDict[bytes, float]" = OrderedDict()
+    cache_cap = 4 * pop_size
+
+    # Elites pass through to the next generation unchanged (crossover and
+    # mutation only touch the remaining rows), so their scores carry over
+    # verbatim and skip evaluation entirely.
+    elite_k = max(2, pop_size // 5)
+    elite_scores: Optional[np.ndarray] = None
+
+    try:
+        for gen in range(n_generations):
+            # Ring migration (island model): on migration generations, ship a
+            # copy of the current elites to the next island and let any
+            # immigrants that have arrived replace the worst child rows; they
+            # get scored in this generation's normal evaluation pass. All
+            # queue traffic is non-blocking so islands never stall on each
+            # other.
+            if (
+                migration_queues is not None
+                and gen > 0
+                and gen % migration_interval == 0
+            ):
+                out_queue, in_queue = migration_queues
+                k = min(2, elite_k)
+                try:
+                    out_queue.put_nowait(population[:k].copy())
+                except Full:
+                    pass
+                try:
+                    while True:
+                        immigrants = in_queue.get_nowait()
+                        m = min(len(immigrants), pop_size - elite_k)
+                        if m > 0:
+                            population[pop_size - m:] = immigrants[:m]
+                except Empty:
+                    pass
+
+            keys = [g.tobytes() for g in population]
+
+            scores = np.empty(pop_size, dtype=np.float64)
+            carried = 0
+            if elite_scores is not None:
+                carried = elite_k
+                scores[:carried] = elite_scores
+                # Re-insert so duplicate children still hit the cache.
+                for i in range(carried):
+                    fitness_cache[keys[i]] = scores[i]
+
+            pending: Dict[bytes, int] = {}
+            for i in range(carried, pop_size):
+                k = keys[i]
+                if k not in fitness_cache and k not in pending:
+                    pending[k] = i
+            miss_scores = map_fn(evaluate, [population[i] for i in pending.values()])
+            for k, s in zip(pending, miss_scores):
+                fitness_cache[k] = s
+
+            for i in range(carried, pop_size):
+                k = keys[i]
+                fitness_cache.move_to_end(k)
+                scores[i] = fitness_cache[k]
+            while len(fitness_cache) > cache_cap:
+                fitness_cache.popitem(last=False)
+
+            # Population-level bookkeeping as array ops: one argsort instead of
+            # sorting (score, genome) tuple pairs. The decode itself stays
+            # per-genome (the permutation decoder is inherently sequential).
+            order = np.argsort(-scores)
+            if best_score is None or scores[order[0]] > best_score:
+                best_score = float(scores[order[0]])
+                best_genome = population[order[0]].copy()
+
+            # Parents are gathered into next_pop; children are then written back
+            # over the old population rows, so the two buffers just swap roles
+            # each generation and no per-genome lists are allocated.
+            elite_scores = scores[order[:elite_k]].copy()
+            next_pop[:elite_k] = population[order[:elite_k]]
+
+            # Tournament selection in one shot: draw both contestant index
+            # vectors, compare scores element-wise and gather the winning
+            # parents with a single fancy-indexed copy into next_pop.
+            n_rest = pop_size - elite_k
+            i_idx = rng.integers(0, pop_size, size=n_rest)
+            j_idx = rng.integers(0, pop_size, size=n_rest)
+            collide = i_idx == j_idx
+            j_idx[collide] = (j_idx[collide] + 1) % pop_size
+            winners = np.where(scores[i_idx] > scores[j_idx], i_idx, j_idx)
+            next_pop[elite_k:] = population[winners]
+
+            # All per-child randomness drawn in one batch per generation:
+            # OX cut points, mutation gate and swap positions.
+            cross_ab = np.sort(rng.integers(0, n_comp, size=(pop_size, 2)), axis=1)
+            mut_draw = rng.random(pop_size)
+            swap_ij = rng.integers(0, n_comp, size=(pop_size, 2))
+            collide = swap_ij[:, 0] == swap_ij[:, 1]
+            swap_ij[collide, 1] = (swap_ij[collide, 1] + 1) % n_comp
+
+            population[:elite_k] = next_pop[:elite_k]
+            for i in range(elite_k, pop_size, 2):
+                if i + 1 >= pop_size:
+                    population[i] = next_pop[i]
+                    break
+                _crossover_ox(
+                    next_pop[i], next_pop[i + 1], population[i], ox_mask,
+                    cross_ab[i, 0], cross_ab[i, 1],
+                )
+                _crossover_ox(
+                    next_pop[i + 1], next_pop[i], population[i + 1], ox_mask,
+                    cross_ab[i + 1, 0], cross_ab[i + 1, 1],
+                )
 
-        for i in range(len(children)):
-            if random.random() < mutation_rate:
-                children[i] = _mutate_swap(children[i][:])
+            for i in range(elite_k, pop_size):
+                if mut_draw[i] < mutation_rate:
+                    _mutate_swap(population[i], swap_ij[i, 0], swap_ij[i, 1])
 
-        population = children[:pop_size]
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
-    final_tasks, final_unmet, due_day_by_id, lead_time_days_by_id = _decode_v2(
+    final_tasks, final_unmet, due_day_by_id, lead_time_days_by_id, final_cols = _decode_v2(
         genome=best_genome,
         components=components,
         machines=machines,
@@ -940,11 +1457,154 @@ def ga_optimize_v2(
         color_change_time_minutes=color_change_time_minutes,
         current_date=current_date,
         shift_start_time=start_time,
+        machine_mold_compat=machine_mold_compat,
+        mold_index=mold_index,
+        piece_hours=piece_hours,
+        day_windows=day_windows,
+        open_quantity=open_quantity,
+        dep_ctx=dep_ctx,
+        feasible=feasible,
+        prereq_csr=prereq_csr,
+    )
+    final_score = fitness_from_columns(
+        final_cols.task_type,
+        final_cols.day,
+        final_cols.qty,
+        final_cols.used_hours,
+        final_cols.comp_idx,
+        sum(final_unmet.values()),
+        due_day_arr,
+        latest_arr,
     )
-    final_score = _fitness_v2(final_tasks, final_unmet, components, due_day_by_id, lead_time_days_by_id)
 
     return {
         "assignments": final_tasks,
         "unmet": final_unmet,
         "score": final_score,
-    }
\ No newline at end of file
+    }
+
+def _island_worker(
+    result_queue: "multiprocessing.Queue",
+    out_queue: "multiprocessing.Queue",
+    in_queue: "multiprocessing.Queue",
+    kwargs: Dict[str, Any],
+) -> None:
+    """Run one island and report its best schedule (top-level: picklable).
+
+    Failures are posted on the result queue as the exception itself; a
+    silently dying worker would otherwise leave the parent blocked on a
+    result that never arrives.
+    """
+    try:
+        result_queue.put(
+            ga_optimize_v2(migration_queues=(out_queue, in_queue), **kwargs)
+        )
+    except Exception as exc:
+        result_queue.put(exc)
+
+
+def ga_optimize_islands(
+    components: List[ProductComponent],
+    machines: List[Machine],
+    molds: List[Mold],
+    month_days: int,
+    mold_change_time_minutes: int,
+    color_change_time_minutes: int,
+    current_date: date,
+    start_time: time,
+    pop_size: int = 30,
+    n_generations: int = 80,
+    mutation_rate: float = 0.25,
+    n_islands: int = 2,
+    migration_interval: int = 10,
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Island-model GA: parallel sub-populations with ring migration.
+
+    Each island runs ga_optimize_v2 on pop_size // n_islands genomes in its
+    own process with its own RNG stream; every migration_interval
+    generations an island ships its elites to the next island in the ring,
+    so good orderings spread without the islands converging in lockstep.
+    With n_islands <= 1 this degrades to a single panmictic run.
+    """
+    # One OS process per island: cap at the core count (two islands minimum,
+    # so small hosts keep the diversity benefit) so an oversized request
+    # can't fork-bomb the host.
+    n_islands = min(n_islands, max(2, multiprocessing.cpu_count()))
+    if n_islands <= 1:
+        return ga_optimize_v2(
+            components=components,
+            machines=machines,
+            molds=molds,
+            month_days=month_days,
+            mold_change_time_minutes=mold_change_time_minutes,
+            color_change_time_minutes=color_change_time_minutes,
+            current_date=current_date,
+            start_time=start_time,
+            pop_size=pop_size,
+            n_generations=n_generations,
+            mutation_rate=mutation_rate,
+            migration_interval=migration_interval,
+            seed=seed,
+        )
+
+    island_pop = max(2, pop_size // n_islands)
+
+    # A seeded run derives one stream per island from the caller's seed;
+    # an unseeded run draws fresh entropy so repeated calls don't replay
+    # the same fixed per-island streams.
+    if seed is None:
+        island_seeds = [int(s) for s in np.random.SeedSequence().generate_state(n_islands)]
+    else:
+        island_seeds = [seed + i for i in range(n_islands)]
+
+    ctx = multiprocessing.get_context()
+    inboxes = [ctx.Queue() for _ in range(n_islands)]
+    result_queue = ctx.Queue()
+
+    procs = []
+    for i in range(n_islands):
+        kwargs = dict(
+            components=components,
+            machines=machines,
+            molds=molds,
+            month_days=month_days,
+            mold_change_time_minutes=mold_change_time_minutes,
+            color_change_time_minutes=color_change_time_minutes,
+            current_date=current_date,
+            start_time=start_time,
+            pop_size=island_pop,
+            n_generations=n_generations,
+            mutation_rate=mutation_rate,
+            migration_interval=migration_interval,
+            seed=island_seeds[i],
+        )
+        procs.append(
+            ctx.Process(
+                target=_island_worker,
+                args=(result_queue, inboxes[(i + 1) % n_islands], inboxes[i], kwargs),
+                daemon=True,
+            )
+        )
+    for p in procs:
+        p.start()
+
+    results = [result_queue.get() for _ in range(n_islands)]
+
+    # Drain migration payloads still buffered in the ring before joining:
+    # receivers only empty their inbox on migration generations, and a
+    # worker cannot exit while its queue feeder thread is blocked flushing
+    # an undelivered elite batch into a full pipe — join() would hang.
+    for q in inboxes:
+        try:
+            while True:
+                q.get_nowait()
+        except Empty:
+            pass
+    for p in procs:
+        p.join()
+
+    for r in results:
+        if isinstance(r, Exception):
+            raise r
+    return max(results, key=lambda r: r["score"])
@@ -0,0 +1,178 @@
+# app/services/ga_scheduler_kernels.py
+"""Numba-JIT kernels for the GA scheduler hot path.
+
+The fitness arithmetic lives here as a plain-loop kernel over typed
+ndarrays (no Python objects), so numba can compile it to native code.
+"""
+from typing import Any, Dict, List
+
+import numpy as np
+from numba import njit
+
+# Task-type codes shared between the decoder output and the kernel.
+TASK_PRODUCE = 0
+TASK_CHANGE_MOLD = 1
+TASK_CHANGE_COLOR = 2
+TASK_WAIT = 3
+TASK_TRANSFER = 4
+
+TASK_TYPE_CODES = {
+    "PRODUCE": TASK_PRODUCE,
+    "CHANGE_MOLD": TASK_CHANGE_MOLD,
+    "CHANGE_COLOR": TASK_CHANGE_COLOR,
+    "WAIT": TASK_WAIT,
+    "TRANSFER": TASK_TRANSFER,
+}
+
+_NO_PRODUCTION = 1_000_000
+
+
+@njit(fastmath=True, cache=True)
+def _fitness_numba(
+    task_type: np.ndarray,      # int8
+    task_day: np.ndarray,       # int16
+    task_qty: np.ndarray,       # int32
+    task_used_hours: np.ndarray,  # float64
+    task_comp_idx: np.ndarray,  # int32
+    due_day: np.ndarray,        # int16, clamped to [1, month_days]
+    latest_start: np.ndarray,   # int16, due - lead clamped to >= 1
+    unmet_pen: float,
+) -> float:
+    n_components = due_day.shape[0]
+
+    produced_total = 0
+    on_time_qty = 0
+    late_qty = 0
+    weighted_late_qty = 0
+
+    changeover_hours = 0.0
+    wait_hours = 0.0
+    transfer_hours = 0.0
+
+    first_prod_day = np.full(n_components, _NO_PRODUCTION, dtype=np.int32)
+
+    for i in range(task_type.shape[0]):
+        tt = task_type[i]
+        if tt == TASK_PRODUCE:
+            qty = task_qty[i]
+            produced_total += qty
+            c = task_comp_idx[i]
+            d = task_day[i]
+            if d < first_prod_day[c]:
+                first_prod_day[c] = d
+
+            dd = due_day[c]
+            if d <= dd:
+                on_time_qty += qty
+            else:
+                days_late = d - dd
+                if days_late < 1:
+                    days_late = 1
+                late_qty += qty
+                weighted_late_qty += qty * days_late
+        elif tt == TASK_CHANGE_MOLD or tt == TASK_CHANGE_COLOR:
+            changeover_hours += task_used_hours[i]
+        elif tt == TASK_WAIT:
+            wait_hours += task_used_hours[i]
+        elif tt == TASK_TRANSFER:
+            transfer_hours += task_used_hours[i]
+
+    late_start_pen = 0.0
+    for c in range(n_components):
+        d = first_prod_day[c]
+        if d == _NO_PRODUCTION:
+            continue
+        ls = latest_start[c]
+        if d > ls:
+            late_start_pen += (d - ls) * 2_000.0
+
+    late_prod_pen = (late_qty * 2_000.0) + (weighted_late_qty * 500.0)
+
+    return (
+        on_time_qty * 5.0
+        + produced_total * 1.0
+        - unmet_pen
+        - late_prod_pen
+        - late_start_pen
+        - (changeover_hours * 50.0)
+        - (transfer_hours * 20.0)
+        - (wait_hours * 5.0)
+    )
+
+
+def fitness_from_tasks(
+    tasks: List[Dict[str, Any]],
+    unmet: Dict[str, int],
+    comp_index: Dict[str, int],
+    due_day: np.ndarray,
+    latest_start: np.ndarray,
+) -> float:
+    """Pack a decoded task list into typed arrays and score with the kernel."""
+    n = len(tasks)
+    task_type = np.empty(n, dtype=np.int8)
+    task_day = np.empty(n, dtype=np.int16)
+    task_qty = np.zeros(n, dtype=np.int32)
+    task_used_hours = np.empty(n, dtype=np.float64)
+    task_comp_idx = np.zeros(n, dtype=np.int32)
+
+    for i, t in enumerate(tasks):
+        tt = TASK_TYPE_CODES[t["task_type"]]
+        task_type[i] = tt
+        task_day[i] = t["day"]
+        task_used_hours[i] = t.get("used_hours", 0.0)
+        if tt == TASK_PRODUCE:
+            task_qty[i] = t.get("produced_qty", 0)
+            task_comp_idx[i] = comp_index[t["component_id"]]
+
+    unmet_pen = float(sum(unmet.values())) * 1_000_000.0
+    return float(
+        _fitness_numba(
+            task_type, task_day, task_qty, task_used_hours, task_comp_idx,
+            due_day, latest_start, unmet_pen,
+        )
+    )
+
+
+def fitness_from_columns(
+    task_type: List[int],
+    task_day: List[int],
+    task_qty: List[int],
+    task_used_hours: List[float],
+    task_comp_idx: List[int],
+    unmet_total: int,
+    due_day: np.ndarray,
+    latest_start: np.ndarray,
+) -> float:
+    """Score SoA task columns accumulated during decode.
+
+    The columns arrive as plain Python lists appended in decode order; the
+    conversion to typed arrays is one C-level pass per column instead of the
+    per-task dict walk in fitness_from_tasks.
+    """
+    unmet_pen = float(unmet_total) * 1_000_000.0
+    return float(
+        _fitness_numba(
+            np.asarray(task_type, dtype=np.int8),
+            np.asarray(task_day, dtype=np.int16),
+            np.asarray(task_qty, dtype=np.int32),
+            np.asarray(task_used_hours, dtype=np.float64),
+            np.asarray(task_comp_idx, dtype=np.int32),
+            due_day,
+            latest_start,
+            unmet_pen,
+        )
+    )
+
+
+# Warm the JIT at import with a dummy call so the first request doesn't pay
+# compile time (cache=True persists the compiled kernel across processes).
+_fitness_numba(
+    np.zeros(1, dtype=np.int8),
+    np.ones(1, dtype=np.int16),
+    np.zeros(1, dtype=np.int32),
+    np.zeros(1, dtype=np.float64),
+    np.zeros(1, dtype=np.int32),
+    np.ones(1, dtype=np.int16),
+    np.ones(1, dtype=np.int16),
+    0.0,
+)